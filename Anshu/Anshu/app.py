@@ -4,9 +4,7 @@ A comprehensive Business Intelligence dashboard for StyleNest company
 """
 
 import streamlit as st
-import json
-import os
-from pathlib import Path
+from stylenest.styles import inject_css
 
 # Page configuration
 st.set_page_config(
@@ -16,19 +14,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load custom CSS
-def load_css():
-    css_path = Path(__file__).parent / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
 # Initialize session state
 if 'selected_role' not in st.session_state:
     st.session_state.selected_role = "CEO"
 
 # Load CSS
-load_css()
+inject_css()
 
 # Header
 st.markdown("""
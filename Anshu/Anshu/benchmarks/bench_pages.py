@@ -0,0 +1,196 @@
+"""
+Page Benchmark
+Runs every dashboard page headlessly with Streamlit's AppTest against synthetic
+datasets at several scales and reports per-run latency, memory and payload size
+
+Usage:
+    python benchmarks/bench_pages.py                      # 1x, 100x, 10000x
+    python benchmarks/bench_pages.py --scales 1 100 --json results.json
+    python benchmarks/bench_pages.py --baseline results.json --tolerance 0.25
+    python benchmarks/bench_pages.py --scales 100 --orders 1000000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+import pandas as pd
+from pandas.core.generic import NDFrame
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+from stylenest import data, synth
+
+PAGES = ["app.py"] + sorted(f"pages/{p.name}" for p in (APP_DIR / "pages").glob("*.py"))
+
+DEFAULT_SCALES = (1, 100, 10_000)
+
+
+def reset_caches():
+    """Drop every in-process cache so the next run pays the full load cost."""
+    from stylenest import charts, kpis
+
+    data._datasets.clear()
+    data._streams.clear()
+    charts.figure_cache.clear()
+    for value in vars(kpis).values():
+        if hasattr(value, "cache_clear"):
+            value.cache_clear()
+
+
+class Probe:
+    """Counts DataFrame constructions and captures the forward messages of one run.
+
+    Copies, slices, groupby results and assign() build their frames from a
+    block manager without calling DataFrame.__init__, so the count hooks
+    NDFrame.__init__, which every DataFrame passes through exactly once.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.messages = []
+        self._init = NDFrame.__init__
+        self._parse = local_script_runner.parse_tree_from_messages
+
+    @classmethod
+    def check(cls):
+        """Raise if the probe misses frames that pandas builds without DataFrame.__init__."""
+        frame = pd.DataFrame({"key": [1, 2, 1], "value": [1.0, 2.0, 3.0]})
+        derived = (lambda: frame.copy(), lambda: frame.iloc[1:], lambda: frame[["value"]],
+                   lambda: frame.assign(double=frame["value"] * 2))
+        for build in derived:
+            with cls() as probe:
+                build()
+            if probe.frames != 1:
+                raise RuntimeError(f"DataFrame probe counted {probe.frames} frames for one derived frame")
+
+    def __enter__(self):
+        probe = self
+        original_init = self._init
+        original_parse = self._parse
+
+        def counting_init(frame, *args, **kwargs):
+            if isinstance(frame, pd.DataFrame):
+                probe.frames += 1
+            original_init(frame, *args, **kwargs)
+
+        def capturing_parse(messages):
+            probe.messages = list(messages)
+            return original_parse(messages)
+
+        NDFrame.__init__ = counting_init
+        local_script_runner.parse_tree_from_messages = capturing_parse
+        return self
+
+    def __exit__(self, *exc):
+        NDFrame.__init__ = self._init
+        local_script_runner.parse_tree_from_messages = self._parse
+
+    @property
+    def delta_bytes(self):
+        return sum(message.ByteSize() for message in self.messages)
+
+    @property
+    def figure_bytes(self):
+        total = 0
+        for message in self.messages:
+            if message.WhichOneof("type") != "delta":
+                continue
+            element = message.delta.new_element
+            if message.delta.WhichOneof("type") == "new_element" and element.WhichOneof("type") == "plotly_chart":
+                total += len(element.plotly_chart.spec)
+        return total
+
+
+def measure(app_test):
+    tracemalloc.start()
+    with Probe() as probe:
+        start = time.perf_counter()
+        app_test.run(timeout=600)
+        wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_s": round(wall, 4),
+        "peak_mb": round(peak / 2**20, 2),
+        "dataframes": probe.frames,
+        "delta_bytes": probe.delta_bytes,
+        "figure_bytes": probe.figure_bytes,
+        "error": app_test.exception[0].value if app_test.exception else None,
+    }
+
+
+def run(scales, pages=PAGES, orders=0, seed=0):
+    results = []
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            synth.generate(tmp, orders=orders * scale, seed=seed, **synth.scale_params(scale))
+            data.DATA_DIR = Path(tmp)
+            reset_caches()
+            for page in pages:
+                app_test = AppTest.from_file(str(APP_DIR / page), default_timeout=600)
+                # First run pays parsing and figure building, the rerun shows
+                # the steady-state cost of a widget interaction.
+                for phase in ("cold", "rerun"):
+                    result = {"scale": scale, "page": page, "phase": phase}
+                    result.update(measure(app_test))
+                    results.append(result)
+                    print(f"{scale:>6}x  {page:<32} {phase:<5}  {result['wall_s']:>8.3f}s  "
+                          f"{result['peak_mb']:>8.1f}MB  {result['dataframes']:>5} frames  "
+                          f"{result['delta_bytes']:>10,}B delta  {result['figure_bytes']:>10,}B figures"
+                          + (f"  ERROR {result['error']}" if result["error"] else ""),
+                          flush=True)
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Metrics that grew by more than tolerance relative to a previous run."""
+    previous = {(r["scale"], r["page"], r["phase"]): r for r in baseline}
+    found = []
+    for result in results:
+        before = previous.get((result["scale"], result["page"], result["phase"]))
+        if before is None:
+            continue
+        for metric in ("wall_s", "peak_mb", "dataframes", "delta_bytes", "figure_bytes"):
+            if before[metric] and result[metric] > before[metric] * (1 + tolerance):
+                found.append(f"{result['scale']}x {result['page']} {result['phase']} {metric}: "
+                             f"{before[metric]} -> {result[metric]}")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--pages", nargs="+", default=PAGES)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="fail if any metric regressed against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--orders", type=int, default=0, help="order lines per unit of scale")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.chdir(APP_DIR)
+    Probe.check()
+    results = run(args.scales, args.pages, args.orders, args.seed)
+    failed = [r for r in results if r["error"]]
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        found = regressions(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}")
+        if found:
+            return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,17 @@ Displays high-level KPIs and strategic insights for C-level executives
 """
 
 import streamlit as st
-import json
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-from pathlib import Path
+from stylenest.charts import apply_theme, cached_figure, render_mode, scatter_trace
+from stylenest.cube import sales_cube
+from stylenest.data import get_dataset
+from stylenest.downsample import downsample
+from stylenest.drilldown import drill_down
+from stylenest.kpis import ceo_kpis, sales_rollups
+from stylenest.styles import inject_css
+from stylenest.timeindex import daily_sales_index
+from stylenest.widgets import date_range_filter, zoom_window
 
 # Page configuration
 st.set_page_config(
@@ -19,22 +25,16 @@ st.set_page_config(
 )
 
 # Load custom CSS
-def load_css():
-    css_path = Path(__file__).parent.parent / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-load_css()
+inject_css()
 
 # Load data
-@st.cache_data
-def load_data():
-    data_path = Path(__file__).parent.parent / "data" / "sales.json"
-    with open(data_path, "r") as f:
-        return json.load(f)
+data = get_dataset("sales")
+daily_index = daily_sales_index(data)
 
-data = load_data()
+# Date range filter
+date_range = date_range_filter(daily_index, key="ceo_date_range")
+date_window = daily_index.window(date_range)
+kpis = ceo_kpis(data, date_window)
 
 # Header
 st.markdown("""
@@ -53,7 +53,7 @@ with col1:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Total Revenue</div>
-            <div class='kpi-value'>${data['total_revenue']/1000:.1f}K</div>
+            <div class='kpi-value'>${kpis['total_revenue']/1000:.1f}K</div>
             <div class='kpi-change positive'>↑ 12% vs last month</div>
         </div>
     """, unsafe_allow_html=True)
@@ -62,16 +62,21 @@ with col2:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Profit Margin</div>
-            <div class='kpi-value'>{data['profit_margin']}%</div>
+            <div class='kpi-value'>{kpis['profit_margin']}%</div>
             <div class='kpi-change positive'>↑ 2.5% vs last quarter</div>
         </div>
     """, unsafe_allow_html=True)
 
 with col3:
+    # Orders are not tracked per day, so a filtered range shows units instead
+    if date_window:
+        orders_label, orders_value = "Units Sold", kpis['total_units']
+    else:
+        orders_label, orders_value = "Total Orders", kpis['total_orders']
     st.markdown(f"""
         <div class='kpi-card'>
-            <div class='kpi-label'>Total Orders</div>
-            <div class='kpi-value'>{data['total_orders']/1000:.1f}K</div>
+            <div class='kpi-label'>{orders_label}</div>
+            <div class='kpi-value'>{orders_value/1000:.1f}K</div>
             <div class='kpi-change positive'>↑ 8% growth</div>
         </div>
     """, unsafe_allow_html=True)
@@ -80,7 +85,7 @@ with col4:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Customer Satisfaction</div>
-            <div class='kpi-value'>{data['customer_satisfaction']}%</div>
+            <div class='kpi-value'>{kpis['customer_satisfaction']}%</div>
             <div class='kpi-change positive'>↑ 3% improvement</div>
         </div>
     """, unsafe_allow_html=True)
@@ -95,28 +100,37 @@ with col1:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Monthly Sales Trend</div>", unsafe_allow_html=True)
     
-    monthly_df = pd.DataFrame(data['monthly_sales'])
-    fig = px.line(
-        monthly_df, 
-        x='month', 
-        y='revenue',
-        markers=True,
-        title="",
-        labels={'revenue': 'Revenue ($)', 'month': 'Month'}
-    )
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155'),
-        yaxis=dict(gridcolor='#334155'),
-        hovermode='x unified'
-    )
-    fig.update_traces(
-        line_color='#6366f1',
-        marker_color='#8b5cf6',
-        line_width=3
-    )
+    # Same daily index as the Total Revenue card, so the months add up to it
+    monthly_df = sales_rollups(data, date_window)['monthly']
+    monthly_df = monthly_df.assign(month=monthly_df['date'].dt.strftime('%b %Y')).rename(columns={'sales': 'revenue'})
+    monthly_zoom = zoom_window(monthly_df['month'], key=f"ceo_monthly_zoom_{date_range}")
+
+    def monthly_sales_figure():
+        visible_df = downsample(monthly_df, None, 'revenue', window=monthly_zoom)
+        fig = px.line(
+            visible_df, 
+            x='month', 
+            y='revenue',
+            markers=True,
+            title="",
+            labels={'revenue': 'Revenue ($)', 'month': 'Month'},
+            render_mode=render_mode(len(visible_df))
+        )
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155'),
+            yaxis=dict(gridcolor='#334155'),
+            hovermode='x unified'
+        )
+        fig.update_traces(
+            line_color='#6366f1',
+            marker_color='#8b5cf6',
+            line_width=3
+        )
+        return fig
+    
+    fig = cached_figure("ceo/monthly_sales", data.version, monthly_sales_figure,
+                         (date_window, monthly_zoom))
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -125,24 +139,26 @@ with col2:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Category-wise Revenue</div>", unsafe_allow_html=True)
     
-    category_df = pd.DataFrame(data['category_revenue'])
-    fig = px.bar(
-        category_df,
-        x='category',
-        y='revenue',
-        title="",
-        labels={'revenue': 'Revenue ($)', 'category': 'Category'},
-        color='revenue',
-        color_continuous_scale='viridis'
-    )
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155'),
-        yaxis=dict(gridcolor='#334155'),
-        showlegend=False
-    )
+    def category_revenue_figure():
+        category_df = data.table('category_revenue')
+        fig = px.bar(
+            category_df,
+            x='category',
+            y='revenue',
+            title="",
+            labels={'revenue': 'Revenue ($)', 'category': 'Category'},
+            color='revenue',
+            color_continuous_scale='viridis'
+        )
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155'),
+            yaxis=dict(gridcolor='#334155'),
+            showlegend=False
+        )
+        return fig
+    
+    fig = cached_figure("ceo/category_revenue", data.version, category_revenue_figure)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -150,57 +166,67 @@ with col2:
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>Regional Customer Growth</div>", unsafe_allow_html=True)
 
-regional_df = pd.DataFrame(data['regional_growth'])
-fig = go.Figure()
-
-fig.add_trace(go.Bar(
-    x=regional_df['region'],
-    y=regional_df['customers'],
-    name='Customers',
-    marker_color='#6366f1',
-    text=regional_df['customers'],
-    textposition='outside'
-))
-
-fig.add_trace(go.Scatter(
-    x=regional_df['region'],
-    y=regional_df['growth'] * 100,
-    name='Growth %',
-    yaxis='y2',
-    mode='lines+markers',
-    line=dict(color='#ec4899', width=3),
-    marker=dict(size=10)
-))
-
-fig.update_layout(
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font_color='#94a3b8',
-    xaxis=dict(gridcolor='#334155'),
-    yaxis=dict(
-        title='Number of Customers',
-        gridcolor='#334155',
-        side='left'
-    ),
-    yaxis2=dict(
-        title='Growth Percentage (%)',
-        overlaying='y',
-        side='right',
-        gridcolor='#334155'
-    ),
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="right",
-        x=1
-    ),
-    hovermode='x unified'
-)
+def regional_growth_figure():
+    regional_df = data.table('regional_growth')
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=regional_df['region'],
+        y=regional_df['customers'],
+        name='Customers',
+        marker_color='#6366f1',
+        text=regional_df['customers'],
+        textposition='outside'
+    ))
+
+    fig.add_trace(scatter_trace(
+        x=regional_df['region'],
+        y=regional_df['growth'] * 100,
+        name='Growth %',
+        yaxis='y2',
+        mode='lines+markers',
+        line=dict(color='#ec4899', width=3),
+        marker=dict(size=10)
+    ))
+
+    apply_theme(
+        fig,
+        xaxis=dict(gridcolor='#334155'),
+        yaxis=dict(
+            title='Number of Customers',
+            gridcolor='#334155',
+            side='left'
+        ),
+        yaxis2=dict(
+            title='Growth Percentage (%)',
+            overlaying='y',
+            side='right',
+            gridcolor='#334155'
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        hovermode='x unified'
+    )
+    return fig
 
+fig = cached_figure("ceo/regional_growth", data.version, regional_growth_figure)
 st.plotly_chart(fig, use_container_width=True)
 st.markdown("</div>", unsafe_allow_html=True)
 
+# Regional Sales Drill-Down - Full Width, with order-level data. Clicking a
+# region drills into its category and product sales.
+cube = sales_cube(data)
+if cube is not None:
+    st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
+    st.markdown("<div class='chart-title'>Regional Sales Drill-Down</div>", unsafe_allow_html=True)
+    drill_down(cube, key="ceo_region_drill", version=data.version)
+    st.markdown("</div>", unsafe_allow_html=True)
+
 # Back to Home
 st.sidebar.markdown("---")
 if st.sidebar.button("🏠 Back to Home"):
@@ -4,11 +4,14 @@ Displays marketing analytics, campaign performance, and social media insights
 """
 
 import streamlit as st
-import json
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-from pathlib import Path
+from stylenest.campaigns import campaign_stats, spend_curve
+from stylenest.charts import apply_theme, cached_figure, render_mode, scatter_trace
+from stylenest.data import get_dataset
+from stylenest.kpis import marketing_kpis
+from stylenest.styles import inject_css
+from stylenest.tables import count_column, money_column, paged_table, percent_column, table_index
 
 # Page configuration
 st.set_page_config(
@@ -19,22 +22,11 @@ st.set_page_config(
 )
 
 # Load custom CSS
-def load_css():
-    css_path = Path(__file__).parent.parent / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-load_css()
+inject_css()
 
 # Load data
-@st.cache_data
-def load_data():
-    data_path = Path(__file__).parent.parent / "data" / "marketing.json"
-    with open(data_path, "r") as f:
-        return json.load(f)
-
-data = load_data()
+data = get_dataset("marketing")
+kpis = marketing_kpis(data)
 
 # Header
 st.markdown("""
@@ -53,7 +45,7 @@ with col1:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Website Visits</div>
-            <div class='kpi-value'>{data['website_visits']/1000:.0f}K</div>
+            <div class='kpi-value'>{kpis['website_visits']/1000:.0f}K</div>
             <div class='kpi-change positive'>↑ 15% vs last month</div>
         </div>
     """, unsafe_allow_html=True)
@@ -62,7 +54,7 @@ with col2:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Conversion Rate</div>
-            <div class='kpi-value'>{data['conversion_rate']}%</div>
+            <div class='kpi-value'>{kpis['conversion_rate']}%</div>
             <div class='kpi-change positive'>↑ 0.5% improvement</div>
         </div>
     """, unsafe_allow_html=True)
@@ -71,7 +63,7 @@ with col3:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Ad Spend</div>
-            <div class='kpi-value'>${data['ad_spend']/1000:.1f}K</div>
+            <div class='kpi-value'>${kpis['ad_spend']/1000:.1f}K</div>
             <div class='kpi-change'>Within budget</div>
         </div>
     """, unsafe_allow_html=True)
@@ -80,7 +72,7 @@ with col4:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Best Campaign</div>
-            <div class='kpi-value' style='font-size: 1.2rem;'>{data['best_campaign']}</div>
+            <div class='kpi-value' style='font-size: 1.2rem;'>{kpis['best_campaign']}</div>
             <div class='kpi-change positive'>Top performer</div>
         </div>
     """, unsafe_allow_html=True)
@@ -95,26 +87,28 @@ with col1:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Social Media Engagement</div>", unsafe_allow_html=True)
     
-    social_df = pd.DataFrame(data['social_media_engagement'])
-    fig = px.bar(
-        social_df,
-        x='platform',
-        y='engagement',
-        title="",
-        labels={'engagement': 'Engagement', 'platform': 'Platform'},
-        color='engagement',
-        color_continuous_scale='plasma',
-        text='engagement'
-    )
-    fig.update_traces(texttemplate='%{text:,}', textposition='outside')
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155'),
-        yaxis=dict(gridcolor='#334155'),
-        showlegend=False
-    )
+    def social_engagement_figure():
+        social_df = data.table('social_media_engagement')
+        fig = px.bar(
+            social_df,
+            x='platform',
+            y='engagement',
+            title="",
+            labels={'engagement': 'Engagement', 'platform': 'Platform'},
+            color='engagement',
+            color_continuous_scale='plasma',
+            text='engagement'
+        )
+        fig.update_traces(texttemplate='%{text:,}', textposition='outside')
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155'),
+            yaxis=dict(gridcolor='#334155'),
+            showlegend=False
+        )
+        return fig
+    
+    fig = cached_figure("marketing/social_engagement", data.version, social_engagement_figure)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -123,31 +117,34 @@ with col2:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Campaign ROI</div>", unsafe_allow_html=True)
     
-    campaign_df = pd.DataFrame(data['campaign_roi'])
-    fig = px.line(
-        campaign_df,
-        x='campaign',
-        y='roi',
-        markers=True,
-        title="",
-        labels={'roi': 'ROI (%)', 'campaign': 'Campaign'},
-        text='roi'
-    )
-    fig.update_traces(
-        line_color='#8b5cf6',
-        marker_color='#ec4899',
-        line_width=3,
-        texttemplate='%{text:.0f}%',
-        textposition='top center'
-    )
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155', tickangle=-45),
-        yaxis=dict(gridcolor='#334155'),
-        hovermode='x unified'
-    )
+    def campaign_roi_figure():
+        campaign_df = campaign_stats(data)
+        fig = px.line(
+            campaign_df,
+            x='campaign',
+            y='roi',
+            markers=True,
+            title="",
+            labels={'roi': 'ROI (%)', 'campaign': 'Campaign'},
+            text='roi',
+            render_mode=render_mode(len(campaign_df))
+        )
+        fig.update_traces(
+            line_color='#8b5cf6',
+            marker_color='#ec4899',
+            line_width=3,
+            texttemplate='%{text:.0f}%',
+            textposition='top center'
+        )
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155', tickangle=-45),
+            yaxis=dict(gridcolor='#334155'),
+            hovermode='x unified'
+        )
+        return fig
+    
+    fig = cached_figure("marketing/campaign_roi", data.version, campaign_roi_figure)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -155,47 +152,95 @@ with col2:
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>Customer Demographics</div>", unsafe_allow_html=True)
 
-demo_df = pd.DataFrame(data['customer_demographics'])
-fig = px.pie(
-    demo_df,
-    values='percentage',
-    names='age_group',
-    title="",
-    hole=0.4,
-    color_discrete_sequence=px.colors.sequential.Viridis
-)
-fig.update_traces(
-    textposition='inside',
-    textinfo='percent+label',
-    hovertemplate='<b>%{label}</b><br>Percentage: %{percent}<br>Count: %{customdata}<extra></extra>',
-    customdata=demo_df['count']
-)
-fig.update_layout(
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font_color='#94a3b8',
-    showlegend=True,
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="center",
-        x=0.5
+def demographics_figure():
+    demo_df = data.table('customer_demographics')
+    fig = px.pie(
+        demo_df,
+        values='percentage',
+        names='age_group',
+        title="",
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.Viridis
     )
-)
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Percentage: %{percent}<br>Count: %{customdata}<extra></extra>',
+        customdata=demo_df['count']
+    )
+    apply_theme(
+        fig,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    return fig
+
+fig = cached_figure("marketing/demographics", data.version, demographics_figure)
 st.plotly_chart(fig, use_container_width=True)
 st.markdown("</div>", unsafe_allow_html=True)
 
+# Cumulative Spend vs Revenue - Full Width, when daily campaign events are available
+curve_df = spend_curve(data)
+if curve_df is not None:
+    st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
+    st.markdown("<div class='chart-title'>Cumulative Spend vs Revenue</div>", unsafe_allow_html=True)
+
+    def spend_curve_figure():
+        fig = go.Figure()
+        fig.add_trace(scatter_trace(
+            x=curve_df['date'],
+            y=curve_df['revenue'],
+            name='Revenue ($)',
+            mode='lines',
+            line=dict(color='#10b981', width=3)
+        ))
+        fig.add_trace(scatter_trace(
+            x=curve_df['date'],
+            y=curve_df['spend'],
+            name='Spend ($)',
+            mode='lines',
+            line=dict(color='#ec4899', width=3),
+            yaxis='y2'
+        ))
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155'),
+            yaxis=dict(title='Revenue ($)', gridcolor='#334155', side='left'),
+            yaxis2=dict(title='Spend ($)', overlaying='y', side='right', gridcolor='#334155'),
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            hovermode='x unified'
+        )
+        return fig
+
+    fig = cached_figure("marketing/spend_curve", data.version, spend_curve_figure)
+    st.plotly_chart(fig, use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
+
 # Additional Metrics Table
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>Campaign Performance Details</div>", unsafe_allow_html=True)
 
-campaign_df = pd.DataFrame(data['campaign_roi'])
-campaign_df['ROI %'] = campaign_df['roi']
-campaign_df['Spend ($)'] = campaign_df['spend']
-campaign_df['Revenue ($)'] = campaign_df['revenue']
-display_df = campaign_df[['campaign', 'Spend ($)', 'Revenue ($)', 'ROI %']]
-st.dataframe(display_df, use_container_width=True, hide_index=True)
+campaign_df = campaign_stats(data)
+campaign_columns = ['campaign', 'spend', 'revenue', 'roi', 'roas']
+if 'conversions' in campaign_df:
+    campaign_columns += ['conversions', 'cpa']
+campaign_index = table_index(("marketing/campaigns", data.version), campaign_df, text_column='campaign')
+paged_table(campaign_index, key="marketing_campaigns", columns=campaign_columns, sort_by='roi',
+            noun="campaigns", column_config={
+                'campaign': 'Campaign',
+                'spend': money_column('Spend ($)'),
+                'revenue': money_column('Revenue ($)'),
+                'roi': percent_column('ROI %', decimals=1),
+                'roas': st.column_config.NumberColumn('ROAS', format='%.2fx'),
+                'conversions': count_column('Conversions'),
+                'cpa': money_column('CPA ($)', decimals=2),
+            })
 st.markdown("</div>", unsafe_allow_html=True)
 
 # Back to Home
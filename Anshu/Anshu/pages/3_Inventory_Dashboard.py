@@ -4,11 +4,16 @@ Displays stock levels, inventory turnover, and supplier performance metrics
 """
 
 import streamlit as st
-import json
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-from pathlib import Path
+from stylenest.catalog import product_catalog, stock_products, with_metadata
+from stylenest.charts import apply_theme, cached_figure
+from stylenest.data import get_dataset
+from stylenest.kpis import inventory_kpis
+from stylenest.ranking import STOCK_METRICS, top_stock_items
+from stylenest.reorder import SAFETY_DAYS, reorder_plan
+from stylenest.styles import inject_css
+from stylenest.tables import count_column, paged_table, status_column, table_index
 
 # Page configuration
 st.set_page_config(
@@ -19,22 +24,13 @@ st.set_page_config(
 )
 
 # Load custom CSS
-def load_css():
-    css_path = Path(__file__).parent.parent / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-load_css()
+inject_css()
 
 # Load data
-@st.cache_data
-def load_data():
-    data_path = Path(__file__).parent.parent / "data" / "inventory.json"
-    with open(data_path, "r") as f:
-        return json.load(f)
-
-data = load_data()
+data = get_dataset("inventory")
+catalog_data = get_dataset("catalog")
+kpis = inventory_kpis(data)
+plan = reorder_plan(data)
 
 # Header
 st.markdown("""
@@ -53,7 +49,7 @@ with col1:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Stock Available</div>
-            <div class='kpi-value'>{data['stock_available']/1000:.0f}K</div>
+            <div class='kpi-value'>{kpis['stock_available']/1000:.0f}K</div>
             <div class='kpi-change'>units</div>
         </div>
     """, unsafe_allow_html=True)
@@ -62,8 +58,8 @@ with col2:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Out of Stock Items</div>
-            <div class='kpi-value'>{data['out_of_stock_items']}</div>
-            <div class='kpi-change negative'>⚠️ Needs attention</div>
+            <div class='kpi-value'>{plan['out_of_stock_items']}</div>
+            <div class='kpi-change negative'>⚠️ {plan['low_stock_items']} more running low</div>
         </div>
     """, unsafe_allow_html=True)
 
@@ -71,7 +67,7 @@ with col3:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Inventory Turnover</div>
-            <div class='kpi-value'>{data['inventory_turnover_ratio']}</div>
+            <div class='kpi-value'>{kpis['inventory_turnover_ratio']}</div>
             <div class='kpi-change positive'>↑ Healthy ratio</div>
         </div>
     """, unsafe_allow_html=True)
@@ -80,7 +76,7 @@ with col4:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Supplier Score</div>
-            <div class='kpi-value'>{data['supplier_performance_score']}/100</div>
+            <div class='kpi-value'>{kpis['supplier_performance_score']}/100</div>
             <div class='kpi-change'>Good performance</div>
         </div>
     """, unsafe_allow_html=True)
@@ -95,44 +91,46 @@ with col1:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Category-wise Stock Levels</div>", unsafe_allow_html=True)
     
-    category_df = pd.DataFrame(data['category_stock'])
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=category_df['category'],
-        y=category_df['stock'],
-        name='Current Stock',
-        marker_color='#6366f1',
-        text=category_df['stock'],
-        textposition='outside'
-    ))
-    
-    fig.add_trace(go.Bar(
-        x=category_df['category'],
-        y=category_df['threshold'],
-        name='Reorder Threshold',
-        marker_color='#ef4444',
-        opacity=0.6,
-        text=category_df['threshold'],
-        textposition='outside'
-    ))
+    def category_stock_figure():
+        category_df = data.table('category_stock')
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            x=category_df['category'],
+            y=category_df['stock'],
+            name='Current Stock',
+            marker_color='#6366f1',
+            text=category_df['stock'],
+            textposition='outside'
+        ))
+        
+        fig.add_trace(go.Bar(
+            x=category_df['category'],
+            y=category_df['threshold'],
+            name='Reorder Threshold',
+            marker_color='#ef4444',
+            opacity=0.6,
+            text=category_df['threshold'],
+            textposition='outside'
+        ))
+        
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155'),
+            yaxis=dict(gridcolor='#334155', title='Units'),
+            barmode='group',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            ),
+            hovermode='x unified'
+        )
+        return fig
     
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155'),
-        yaxis=dict(gridcolor='#334155', title='Units'),
-        barmode='group',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
-        hovermode='x unified'
-    )
+    fig = cached_figure("inventory/category_stock", data.version, category_stock_figure)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -141,58 +139,80 @@ with col2:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Supplier Performance Comparison</div>", unsafe_allow_html=True)
     
-    supplier_df = pd.DataFrame(data['supplier_comparison'])
-    fig = px.bar(
-        supplier_df,
-        x='supplier',
-        y='total_score',
-        title="",
-        labels={'total_score': 'Performance Score', 'supplier': 'Supplier'},
-        color='total_score',
-        color_continuous_scale='viridis',
-        text='total_score'
-    )
-    fig.update_traces(texttemplate='%{text:.0f}', textposition='outside')
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155', tickangle=-45),
-        yaxis=dict(gridcolor='#334155', range=[0, 100]),
-        showlegend=False
-    )
+    def supplier_figure():
+        supplier_df = data.table('supplier_comparison')
+        fig = px.bar(
+            supplier_df,
+            x='supplier',
+            y='total_score',
+            title="",
+            labels={'total_score': 'Performance Score', 'supplier': 'Supplier'},
+            color='total_score',
+            color_continuous_scale='viridis',
+            text='total_score'
+        )
+        fig.update_traces(texttemplate='%{text:.0f}', textposition='outside')
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155', tickangle=-45),
+            yaxis=dict(gridcolor='#334155', range=[0, 100]),
+            showlegend=False
+        )
+        return fig
+    
+    fig = cached_figure("inventory/supplier", data.version, supplier_figure)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
-# Top 10 Selling Products - Table (Full Width)
+# Column labels, number formats and status badges shared by the product tables
+product_columns = {
+    'product': 'Product',
+    'sku': 'SKU',
+    'category': 'Category',
+    'units_sold': count_column('Units Sold'),
+    'stock': count_column('Current Stock'),
+    'daily_demand': st.column_config.NumberColumn('Daily Demand', format='%.2f'),
+    'days_of_cover': st.column_config.NumberColumn('Days of Cover', format='%.1f'),
+    'reorder_point': count_column('Reorder Point'),
+    'reorder_qty': count_column('Reorder Qty'),
+    'status': status_column(),
+}
+
+# Top 10 Products - Table (Full Width)
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
-st.markdown("<div class='chart-title'>Top 10 Selling Products</div>", unsafe_allow_html=True)
-
-products_df = pd.DataFrame(data['top_selling_products'])
-products_df['Units Sold'] = products_df['units_sold']
-products_df['Current Stock'] = products_df['stock']
-products_df['Status'] = products_df['status']
-display_df = products_df[['product', 'Units Sold', 'Current Stock', 'Status']]
-
-# Style the dataframe
-def style_status(val):
-    if val == 'Out of Stock':
-        return 'background-color: rgba(239, 68, 68, 0.2); color: #ef4444;'
-    elif val == 'Low Stock':
-        return 'background-color: rgba(245, 158, 11, 0.2); color: #f59e0b;'
-    else:
-        return 'background-color: rgba(16, 185, 129, 0.2); color: #10b981;'
-
-styled_df = display_df.style.applymap(style_status, subset=['Status'])
-st.dataframe(styled_df, use_container_width=True, hide_index=True)
+st.markdown("<div class='chart-title'>Top 10 Products</div>", unsafe_allow_html=True)
+
+top_metric = st.radio("Rank by", options=list(STOCK_METRICS), format_func=STOCK_METRICS.get,
+                      horizontal=True, key="inventory_top_metric")
+products_df = top_stock_items(data, top_metric)
+display_df = with_metadata(product_catalog(catalog_data),
+                           products_df[['product', 'units_sold', 'stock', 'reorder_qty', 'status']],
+                           fields=('sku', 'category'))
+st.dataframe(display_df, use_container_width=True, hide_index=True, column_config=product_columns)
 st.markdown("</div>", unsafe_allow_html=True)
 
 # Low Stock Alert Section
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>⚠️ Low Stock Alerts</div>", unsafe_allow_html=True)
 
-low_stock_df = pd.DataFrame(data['low_stock_items'])
-st.dataframe(low_stock_df, use_container_width=True, hide_index=True)
+low_stock_index = table_index(("inventory/low_stock", data.version), plan['low_stock'])
+paged_table(low_stock_index, key="inventory_low_stock",
+            columns=['product', 'status', 'stock', 'reorder_point', 'days_of_cover', 'reorder_qty'],
+            column_config=product_columns, sort_by='status', descending=False)
+st.caption(f"{plan['units_to_reorder']:,} units to reorder in total. Reorder points cover "
+           f"supplier lead time plus {SAFETY_DAYS} days of demand unless a reorder level is set.")
+st.markdown("</div>", unsafe_allow_html=True)
+
+# All Products - Table (Full Width)
+st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
+st.markdown("<div class='chart-title'>All Products</div>", unsafe_allow_html=True)
+
+products_index = table_index(("inventory/products", data.version, catalog_data.version),
+                             stock_products(data, catalog_data))
+paged_table(products_index, key="inventory_products",
+            columns=['product', 'sku', 'category', 'status', 'units_sold', 'stock', 'daily_demand',
+                     'days_of_cover', 'reorder_point', 'reorder_qty'],
+            column_config=product_columns, sort_by='units_sold')
 st.markdown("</div>", unsafe_allow_html=True)
 
 # Back to Home
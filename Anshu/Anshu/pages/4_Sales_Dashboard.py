@@ -3,12 +3,23 @@ Sales Executive Dashboard
 Displays daily sales trends, regional performance, and product analytics
 """
 
+import time
+
 import streamlit as st
-import json
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-from pathlib import Path
+from stylenest.catalog import sales_products
+from stylenest.charts import apply_theme, cached_figure, scatter_trace
+from stylenest.cube import sales_cube
+from stylenest.data import get_dataset
+from stylenest.downsample import downsample
+from stylenest.drilldown import drill_down
+from stylenest.kpis import sales_kpis, sales_rollups
+from stylenest.ranking import METRICS, available_metrics, top_products
+from stylenest.styles import inject_css
+from stylenest.tables import count_column, money_column, paged_table, table_index
+from stylenest.timeindex import daily_sales_index
+from stylenest.widgets import date_range_filter, live_refresh, zoom_window
 
 # Page configuration
 st.set_page_config(
@@ -19,28 +30,16 @@ st.set_page_config(
 )
 
 # Load custom CSS
-def load_css():
-    css_path = Path(__file__).parent.parent / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
-
-load_css()
-
-# Load data
-@st.cache_data
-def load_data():
-    sales_path = Path(__file__).parent.parent / "data" / "sales.json"
-    customers_path = Path(__file__).parent.parent / "data" / "customers.json"
-    
-    with open(sales_path, "r") as f:
-        sales_data = json.load(f)
-    with open(customers_path, "r") as f:
-        customers_data = json.load(f)
-    
-    return sales_data, customers_data
-
-sales_data, customers_data = load_data()
+inject_css()
+
+# Live mode: each data section below is a fragment that reruns on its own
+# every `refresh` seconds. get_dataset() only re-reads a source whose files
+# changed, so a tick with no new data is served from the version caches.
+refresh = live_refresh(key="sales")
+
+# Date range filter; each fragment locates the dates in the index of the
+# data it reads, so the window stays right as live mode appends days
+date_range = date_range_filter(daily_sales_index(get_dataset("sales")), key="sales_date_range")
 
 # Header
 st.markdown("""
@@ -53,86 +52,84 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # KPI Cards
-col1, col2, col3, col4 = st.columns(4)
+@st.fragment(run_every=refresh)
+def kpi_cards():
+    sales_data = get_dataset("sales")
+    date_window = daily_sales_index(sales_data).window(date_range)
+    kpis = sales_kpis(sales_data, get_dataset("customers"), date_window)
+    col1, col2, col3, col4 = st.columns(4)
 
-# Calculate daily sales average
-daily_avg = sum([d['sales'] for d in sales_data['daily_sales']]) / len(sales_data['daily_sales'])
-daily_units = sum([d['units'] for d in sales_data['daily_sales']]) / len(sales_data['daily_sales'])
+    with col1:
+        st.markdown(f"""
+            <div class='kpi-card'>
+                <div class='kpi-label'>Daily Sales</div>
+                <div class='kpi-value'>${kpis['daily_avg']/1000:.1f}K</div>
+                <div class='kpi-change positive'>${kpis['sales_7d']/1000:.1f}K last 7 days</div>
+            </div>
+        """, unsafe_allow_html=True)
 
-with col1:
-    st.markdown(f"""
-        <div class='kpi-card'>
-            <div class='kpi-label'>Daily Sales</div>
-            <div class='kpi-value'>${daily_avg/1000:.1f}K</div>
-            <div class='kpi-change positive'>↑ 5% vs yesterday</div>
-        </div>
-    """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+            <div class='kpi-card'>
+                <div class='kpi-label'>Units Sold</div>
+                <div class='kpi-value'>{int(kpis['daily_units'])}</div>
+                <div class='kpi-change positive'>{int(kpis['units_30d']):,} last 30 days</div>
+            </div>
+        """, unsafe_allow_html=True)
 
-with col2:
-    st.markdown(f"""
-        <div class='kpi-card'>
-            <div class='kpi-label'>Units Sold</div>
-            <div class='kpi-value'>{int(daily_units)}</div>
-            <div class='kpi-change positive'>↑ 8% growth</div>
-        </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown(f"""
-        <div class='kpi-card'>
-            <div class='kpi-label'>New Customers</div>
-            <div class='kpi-value'>{customers_data['new_customers_today']}</div>
-            <div class='kpi-change positive'>↑ Today</div>
-        </div>
-    """, unsafe_allow_html=True)
-
-with col4:
-    st.markdown(f"""
-        <div class='kpi-card'>
-            <div class='kpi-label'>Avg Order Value</div>
-            <div class='kpi-value'>${customers_data['avg_order_value']}</div>
-            <div class='kpi-change positive'>↑ $2 increase</div>
-        </div>
-    """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+            <div class='kpi-card'>
+                <div class='kpi-label'>New Customers</div>
+                <div class='kpi-value'>{kpis['new_customers']}</div>
+                <div class='kpi-change positive'>↑ Today</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+            <div class='kpi-card'>
+                <div class='kpi-label'>Avg Order Value</div>
+                <div class='kpi-value'>${kpis['avg_order_value']}</div>
+                <div class='kpi-change positive'>↑ $2 increase</div>
+            </div>
+        """, unsafe_allow_html=True)
+
+    if refresh:
+        st.caption(f"🟢 Live · data version {sales_data.version} · checked {time.strftime('%H:%M:%S')}")
+
+kpi_cards()
 
 st.markdown("<br>", unsafe_allow_html=True)
 
 # Charts Section
 col1, col2 = st.columns(2)
 
-# Daily/Weekly Sales Trend - Line Chart
-with col1:
-    st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
-    st.markdown("<div class='chart-title'>Daily Sales Trend (Last 7 Days)</div>", unsafe_allow_html=True)
-    
-    daily_df = pd.DataFrame(sales_data['daily_sales'])
-    daily_df['date'] = pd.to_datetime(daily_df['date'])
-    
+def daily_sales_figure(daily_df, daily_zoom):
+    visible_df = downsample(daily_df, 'date', 'sales', window=daily_zoom)
     fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=daily_df['date'],
-        y=daily_df['sales'],
+
+    fig.add_trace(scatter_trace(
+        x=visible_df['date'],
+        y=visible_df['sales'],
         name='Sales ($)',
         mode='lines+markers',
         line=dict(color='#6366f1', width=3),
         marker=dict(size=10, color='#8b5cf6'),
         yaxis='y'
     ))
-    
+
     fig.add_trace(go.Bar(
-        x=daily_df['date'],
-        y=daily_df['units'],
+        x=visible_df['date'],
+        y=visible_df['units'],
         name='Units Sold',
         marker_color='#ec4899',
         opacity=0.6,
         yaxis='y2'
     ))
-    
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
+
+    apply_theme(
+        fig,
         xaxis=dict(gridcolor='#334155'),
         yaxis=dict(
             title='Sales ($)',
@@ -154,15 +151,29 @@ with col1:
         ),
         hovermode='x unified'
     )
+    return fig
+
+@st.fragment(run_every=refresh)
+def daily_sales_chart():
+    sales_data = get_dataset("sales")
+    rollup = st.radio("Granularity", options=["daily", "weekly", "monthly"], format_func=str.title,
+                      horizontal=True, key="sales_trend_rollup", label_visibility="collapsed")
+    date_window = daily_sales_index(sales_data).window(date_range)
+    daily_df = sales_rollups(sales_data, date_window)[rollup]
+    daily_zoom = zoom_window(daily_df['date'], key=f"sales_{rollup}_zoom_{date_range}")
+    fig = cached_figure("sales/daily_sales", sales_data.version,
+                        lambda: daily_sales_figure(daily_df, daily_zoom), (rollup, date_window, daily_zoom))
     st.plotly_chart(fig, use_container_width=True)
-    st.markdown("</div>", unsafe_allow_html=True)
 
-# Region-wise Sales - Bar Chart
-with col2:
+# Daily/Weekly Sales Trend - Line Chart
+with col1:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
-    st.markdown("<div class='chart-title'>Region-wise Sales Performance</div>", unsafe_allow_html=True)
-    
-    region_df = pd.DataFrame(sales_data['region_sales'])
+    st.markdown("<div class='chart-title'>Sales Trend</div>", unsafe_allow_html=True)
+    daily_sales_chart()
+    st.markdown("</div>", unsafe_allow_html=True)
+
+def region_sales_figure(sales_data):
+    region_df = sales_data.table('region_sales')
     fig = px.bar(
         region_df,
         x='region',
@@ -177,87 +188,126 @@ with col2:
         texttemplate='$%{text:,.0f}',
         textposition='outside'
     )
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
+    apply_theme(
+        fig,
         xaxis=dict(gridcolor='#334155'),
         yaxis=dict(gridcolor='#334155'),
         showlegend=False
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+@st.fragment(run_every=refresh)
+def region_sales_chart():
+    sales_data = get_dataset("sales")
+    # With order-level data, clicking a region drills into its category and product sales
+    cube = sales_cube(sales_data)
+    if cube is None:
+        fig = cached_figure("sales/region_sales", sales_data.version, lambda: region_sales_figure(sales_data))
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        drill_down(cube, key="sales_region_drill", version=sales_data.version)
+
+# Region-wise Sales - Bar Chart
+with col2:
+    st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
+    st.markdown("<div class='chart-title'>Region-wise Sales Performance</div>", unsafe_allow_html=True)
+    region_sales_chart()
     st.markdown("</div>", unsafe_allow_html=True)
 
 # Product Performance - Full Width
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
-st.markdown("<div class='chart-title'>Top Product Performance</div>", unsafe_allow_html=True)
-
-product_df = pd.DataFrame(sales_data['product_performance'])
-fig = go.Figure()
-
-fig.add_trace(go.Bar(
-    x=product_df['product'],
-    y=product_df['sales'],
-    name='Sales ($)',
-    marker_color='#6366f1',
-    text=product_df['sales'],
-    texttemplate='$%{text:,.0f}',
-    textposition='outside',
-    yaxis='y'
-))
-
-fig.add_trace(go.Scatter(
-    x=product_df['product'],
-    y=product_df['units'],
-    name='Units Sold',
-    mode='lines+markers',
-    line=dict(color='#ec4899', width=3),
-    marker=dict(size=12),
-    yaxis='y2'
-))
-
-fig.update_layout(
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font_color='#94a3b8',
-    xaxis=dict(gridcolor='#334155', tickangle=-45),
-    yaxis=dict(
-        title='Sales ($)',
-        gridcolor='#334155',
-        side='left'
-    ),
-    yaxis2=dict(
-        title='Units Sold',
-        overlaying='y',
-        side='right',
-        gridcolor='#334155'
-    ),
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="right",
-        x=1
-    ),
-    hovermode='x unified'
-)
+st.markdown("<div class='chart-title'>Top 10 Product Performance</div>", unsafe_allow_html=True)
+
+def product_performance_figure(product_df, metric):
+    # Bars show the ranking metric; the line shows units, or sales when ranking by units
+    line_metric = 'sales' if metric == 'units' else 'units'
+    money = {'sales', 'margin'}
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=product_df['product'],
+        y=product_df[metric],
+        name=METRICS[metric],
+        marker_color='#6366f1',
+        text=product_df[metric],
+        texttemplate='$%{text:,.0f}' if metric in money else '%{text:,.0f}',
+        textposition='outside',
+        yaxis='y'
+    ))
+
+    fig.add_trace(scatter_trace(
+        x=product_df['product'],
+        y=product_df[line_metric],
+        name=METRICS[line_metric],
+        mode='lines+markers',
+        line=dict(color='#ec4899', width=3),
+        marker=dict(size=12),
+        yaxis='y2'
+    ))
+
+    apply_theme(
+        fig,
+        xaxis=dict(gridcolor='#334155', tickangle=-45),
+        yaxis=dict(
+            title=METRICS[metric],
+            gridcolor='#334155',
+            side='left'
+        ),
+        yaxis2=dict(
+            title=METRICS[line_metric],
+            overlaying='y',
+            side='right',
+            gridcolor='#334155'
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        ),
+        hovermode='x unified'
+    )
+    return fig
 
-st.plotly_chart(fig, use_container_width=True)
+@st.fragment(run_every=refresh)
+def product_performance_chart():
+    sales_data = get_dataset("sales")
+    metrics = available_metrics(sales_data.table('product_performance'))
+    metric = st.radio("Rank by", options=metrics, format_func=METRICS.get, horizontal=True,
+                      key="sales_top_metric")
+    product_df = top_products(sales_data, metric)
+    fig = cached_figure("sales/product_performance", sales_data.version,
+                        lambda: product_performance_figure(product_df, metric), (metric,))
+    st.plotly_chart(fig, use_container_width=True)
+
+product_performance_chart()
 st.markdown("</div>", unsafe_allow_html=True)
 
 # Product Performance Table
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>Product Sales Details</div>", unsafe_allow_html=True)
 
-product_df['Sales ($)'] = product_df['sales']
-product_df['Units Sold'] = product_df['units']
-display_df = product_df[['product', 'Sales ($)', 'Units Sold']]
-display_df['Sales ($)'] = display_df['Sales ($)'].apply(lambda x: f"${x:,.0f}")
-st.dataframe(display_df, use_container_width=True, hide_index=True)
+@st.fragment(run_every=refresh)
+def product_table():
+    sales_data = get_dataset("sales")
+    catalog_data = get_dataset("catalog")
+    product_df = sales_products(sales_data, catalog_data)
+    index = table_index(("sales/product_performance", sales_data.version, catalog_data.version), product_df)
+    paged_table(index, key="sales_products", columns=['product', 'sku', 'category'] + available_metrics(product_df),
+                sort_by='sales', column_config={
+                    'product': 'Product',
+                    'sku': 'SKU',
+                    'category': 'Category',
+                    'sales': money_column('Sales ($)'),
+                    'units': count_column('Units Sold'),
+                    'margin': money_column('Margin ($)'),
+                })
+
+product_table()
 st.markdown("</div>", unsafe_allow_html=True)
 
 # Back to Home
 st.sidebar.markdown("---")
 if st.sidebar.button("🏠 Back to Home"):
     st.switch_page("app.py")
-
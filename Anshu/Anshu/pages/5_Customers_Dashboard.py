@@ -3,12 +3,22 @@ Customers Dashboard - Customer Insights & Analytics
 Displays customer metrics, segments, and product showcase
 """
 
+import html
+import math
+
 import streamlit as st
-import json
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
-from pathlib import Path
+from stylenest.catalog import SHOWCASE_RANKINGS, product_catalog, showcase_rankings
+from stylenest.charts import apply_theme, cached_figure, render_mode
+from stylenest.cohorts import retention_matrix
+from stylenest.data import data_version, get_dataset
+from stylenest.downsample import downsample
+from stylenest.images import THUMB_SIZE, thumbnail
+from stylenest.kpis import customer_kpis
+from stylenest.rfm import segment_counts
+from stylenest.styles import inject_css
+from stylenest.widgets import zoom_window
 
 # Page configuration
 st.set_page_config(
@@ -19,22 +29,20 @@ st.set_page_config(
 )
 
 # Load custom CSS
-def load_css():
-    css_path = Path(__file__).parent.parent / "styles.css"
-    if css_path.exists():
-        with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+inject_css()
 
-load_css()
+# Cohorts shown in the retention heatmap by default, most recent last
+RETENTION_COHORTS = 12
 
-# Load data
-@st.cache_data
-def load_data():
-    data_path = Path(__file__).parent.parent / "data" / "customers.json"
-    with open(data_path, "r") as f:
-        return json.load(f)
+# Products per page of the showcase grid
+SHOWCASE_PAGE_SIZE = 6
 
-data = load_data()
+# Load data
+data = get_dataset("customers")
+sales_data = get_dataset("sales")
+catalog_data = get_dataset("catalog")
+kpis = customer_kpis(data, sales_data)
+top_segment, top_segment_count = next(iter(kpis['segments'].items()), ("", 0))
 
 # Header
 st.markdown("""
@@ -53,8 +61,8 @@ with col1:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Total Customers</div>
-            <div class='kpi-value'>{data['total_customers']/1000:.1f}K</div>
-            <div class='kpi-change positive'>↑ 5% growth</div>
+            <div class='kpi-value'>{kpis['total_customers']/1000:.1f}K</div>
+            <div class='kpi-change positive'>⭐ {top_segment_count:,} {top_segment}</div>
         </div>
     """, unsafe_allow_html=True)
 
@@ -62,7 +70,7 @@ with col2:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>New Customers Today</div>
-            <div class='kpi-value'>{data['new_customers_today']}</div>
+            <div class='kpi-value'>{kpis['new_customers_today']}</div>
             <div class='kpi-change positive'>↑ 15% vs yesterday</div>
         </div>
     """, unsafe_allow_html=True)
@@ -71,18 +79,16 @@ with col3:
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Avg Order Value</div>
-            <div class='kpi-value'>${data['avg_order_value']}</div>
+            <div class='kpi-value'>${kpis['avg_order_value']}</div>
             <div class='kpi-change positive'>↑ $3 increase</div>
         </div>
     """, unsafe_allow_html=True)
 
 with col4:
-    # Calculate average satisfaction from trend
-    avg_satisfaction = sum([item['score'] for item in data['customer_satisfaction_trend']]) / len(data['customer_satisfaction_trend'])
     st.markdown(f"""
         <div class='kpi-card'>
             <div class='kpi-label'>Avg Satisfaction</div>
-            <div class='kpi-value'>{avg_satisfaction:.1f}%</div>
+            <div class='kpi-value'>{kpis['avg_satisfaction']:.1f}%</div>
             <div class='kpi-change positive'>↑ 2% improvement</div>
         </div>
     """, unsafe_allow_html=True)
@@ -97,28 +103,34 @@ with col1:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Customer Acquisition Trend</div>", unsafe_allow_html=True)
     
-    acquisition_df = pd.DataFrame(data['customer_acquisition'])
-    fig = px.line(
-        acquisition_df, 
-        x='month', 
-        y='new_customers',
-        markers=True,
-        title="",
-        labels={'new_customers': 'New Customers', 'month': 'Month'}
-    )
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        xaxis=dict(gridcolor='#334155'),
-        yaxis=dict(gridcolor='#334155'),
-        hovermode='x unified'
-    )
-    fig.update_traces(
-        line_color='#6366f1',
-        marker_color='#8b5cf6',
-        line_width=3
-    )
+    acquisition_df = data.table('customer_acquisition')
+    acquisition_zoom = zoom_window(acquisition_df['month'], key="customers_acquisition_zoom")
+
+    def acquisition_figure():
+        visible_df = downsample(acquisition_df, None, 'new_customers', window=acquisition_zoom)
+        fig = px.line(
+            visible_df, 
+            x='month', 
+            y='new_customers',
+            markers=True,
+            title="",
+            labels={'new_customers': 'New Customers', 'month': 'Month'},
+            render_mode=render_mode(len(visible_df))
+        )
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155'),
+            yaxis=dict(gridcolor='#334155'),
+            hovermode='x unified'
+        )
+        fig.update_traces(
+            line_color='#6366f1',
+            marker_color='#8b5cf6',
+            line_width=3
+        )
+        return fig
+    
+    fig = cached_figure("customers/acquisition", data.version, acquisition_figure, acquisition_zoom)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -127,32 +139,34 @@ with col2:
     st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
     st.markdown("<div class='chart-title'>Customer Segments Distribution</div>", unsafe_allow_html=True)
     
-    segments_df = pd.DataFrame(data['customer_segments'])
-    fig = px.pie(
-        segments_df,
-        values='count',
-        names='segment',
-        title="",
-        color_discrete_sequence=['#6366f1', '#8b5cf6', '#ec4899']
-    )
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font_color='#94a3b8',
-        showlegend=True,
-        legend=dict(
-            orientation="v",
-            yanchor="middle",
-            y=0.5,
-            xanchor="left",
-            x=1.1
+    def segments_figure():
+        segments_df = segment_counts(sales_data, data)
+        fig = px.pie(
+            segments_df,
+            values='count',
+            names='segment',
+            title="",
+            color_discrete_sequence=['#6366f1', '#8b5cf6', '#ec4899', '#10b981', '#f59e0b', '#64748b']
         )
-    )
-    fig.update_traces(
-        textposition='inside',
-        textinfo='percent+label',
-        textfont_size=12
-    )
+        apply_theme(
+            fig,
+            showlegend=True,
+            legend=dict(
+                orientation="v",
+                yanchor="middle",
+                y=0.5,
+                xanchor="left",
+                x=1.1
+            )
+        )
+        fig.update_traces(
+            textposition='inside',
+            textinfo='percent+label',
+            textfont_size=12
+        )
+        return fig
+    
+    fig = cached_figure("customers/segments", data_version("customers", "sales"), segments_figure)
     st.plotly_chart(fig, use_container_width=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -160,82 +174,122 @@ with col2:
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>Customer Satisfaction Trend</div>", unsafe_allow_html=True)
 
-satisfaction_df = pd.DataFrame(data['customer_satisfaction_trend'])
-fig = px.area(
-    satisfaction_df,
-    x='month',
-    y='score',
-    title="",
-    labels={'score': 'Satisfaction Score (%)', 'month': 'Month'},
-    color_discrete_sequence=['#10b981']
-)
-fig.update_layout(
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    font_color='#94a3b8',
-    xaxis=dict(gridcolor='#334155'),
-    yaxis=dict(gridcolor='#334155', range=[80, 95]),
-    hovermode='x unified'
-)
-fig.update_traces(
-    fill='tonexty',
-    line=dict(width=3)
-)
+def satisfaction_figure():
+    satisfaction_df = data.table('customer_satisfaction_trend')
+    fig = px.area(
+        satisfaction_df,
+        x='month',
+        y='score',
+        title="",
+        labels={'score': 'Satisfaction Score (%)', 'month': 'Month'},
+        color_discrete_sequence=['#10b981']
+    )
+    apply_theme(
+        fig,
+        xaxis=dict(gridcolor='#334155'),
+        yaxis=dict(gridcolor='#334155', range=[80, 95]),
+        hovermode='x unified'
+    )
+    fig.update_traces(
+        fill='tonexty',
+        line=dict(width=3)
+    )
+    return fig
+
+fig = cached_figure("customers/satisfaction", data.version, satisfaction_figure)
 st.plotly_chart(fig, use_container_width=True)
 st.markdown("</div>", unsafe_allow_html=True)
 
-# Clothes Showcase Section
+# Cohort Retention - Heatmap (Full Width), when orders carry a customer_id
+retention_df = retention_matrix(sales_data)
+if retention_df is not None:
+    st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
+    st.markdown("<div class='chart-title'>Cohort Retention</div>", unsafe_allow_html=True)
+
+    cohort_labels = retention_df.index.strftime("%b %Y").tolist()
+    first_cohort = max(len(cohort_labels) - RETENTION_COHORTS, 0)
+    if len(cohort_labels) > 1:
+        cohort_range = st.select_slider("Cohorts", options=range(len(cohort_labels)),
+                                        value=(first_cohort, len(cohort_labels) - 1),
+                                        format_func=lambda i: cohort_labels[i], key="customers_cohorts")
+    else:
+        cohort_range = (0, 0)
+
+    def retention_figure():
+        # Later cohorts have had fewer months to return; the empty cells stay blank
+        visible_df = retention_df.iloc[cohort_range[0]:cohort_range[1] + 1].dropna(axis=1, how='all')
+        fig = go.Figure(go.Heatmap(
+            z=visible_df.to_numpy() * 100,
+            x=[f"Month {period}" for period in visible_df.columns],
+            y=cohort_labels[cohort_range[0]:cohort_range[1] + 1],
+            colorscale='Plasma',
+            zmin=0,
+            zmax=100,
+            texttemplate='%{z:.0f}%' if visible_df.size <= 400 else None,
+            hovertemplate='%{y} cohort, %{x}: %{z:.1f}% active<extra></extra>',
+            colorbar=dict(title='Active %')
+        ))
+        apply_theme(
+            fig,
+            xaxis=dict(gridcolor='#334155', side='top'),
+            yaxis=dict(gridcolor='#334155', autorange='reversed')
+        )
+        return fig
+
+    fig = cached_figure("customers/retention", sales_data.version, retention_figure, cohort_range)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption("Share of each first-order month's customers who ordered again N months later")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+# Product Showcase Section
 st.markdown("<br>", unsafe_allow_html=True)
 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
 st.markdown("<div class='chart-title'>🛍️ Featured Collection</div>", unsafe_allow_html=True)
 
-# Clothes images - using Unsplash URLs for fashion/clothing
-clothes_images = [
-    {
-        "name": "Classic White Shirt",
-        "url": "https://images.unsplash.com/photo-1596755094514-f87e34085b2c?w=400&h=500&fit=crop",
-        "price": "$49.99"
-    },
-    {
-        "name": "Denim Jacket",
-        "url": "https://images.unsplash.com/photo-1551028719-00167b16eac5?w=400&h=500&fit=crop",
-        "price": "$79.99"
-    },
-    {
-        "name": "Elegant Dress",
-        "url": "https://images.unsplash.com/photo-1595777457583-95e059d581b8?w=400&h=500&fit=crop",
-        "price": "$89.99"
-    },
-    {
-        "name": "Casual T-Shirt",
-        "url": "https://images.unsplash.com/photo-1521572163474-6864f9cf17ab?w=400&h=500&fit=crop",
-        "price": "$29.99"
-    },
-    {
-        "name": "Formal Suit",
-        "url": "https://images.unsplash.com/photo-1594938291221-94f18e0e0e6b?w=400&h=500&fit=crop",
-        "price": "$199.99"
-    },
-    {
-        "name": "Summer Shorts",
-        "url": "https://images.unsplash.com/photo-1506629082955-511b1aa562c8?w=400&h=500&fit=crop",
-        "price": "$39.99"
-    }
-]
-
-# Display clothes in a grid
-cols = st.columns(3)
-for idx, item in enumerate(clothes_images):
-    with cols[idx % 3]:
-        st.markdown(f"""
-            <div style='background: rgba(30, 41, 59, 0.5); border-radius: 12px; padding: 1rem; 
-                        margin-bottom: 1rem; border: 1px solid #334155; text-align: center;'>
-                <img src='{item["url"]}' style='width: 100%; height: 300px; object-fit: cover; 
-                     border-radius: 8px; margin-bottom: 0.5rem;' />
-                <h4 style='color: #f1f5f9; margin: 0.5rem 0; font-size: 1rem;'>{item["name"]}</h4>
-                <p style='color: #6366f1; font-size: 1.1rem; font-weight: 600; margin: 0;'>{item["price"]}</p>
-            </div>
-        """, unsafe_allow_html=True)
+# Rankings are precomputed per data version; a query only slices one of them
+catalog = product_catalog(catalog_data)
+rankings = showcase_rankings(catalog_data, sales_data, get_dataset("inventory"))
+if rankings:
+    ranking_col, category_col, page_col = st.columns([3, 2, 1])
+    with ranking_col:
+        ranking = st.radio("Show", options=list(rankings), format_func=SHOWCASE_RANKINGS.get,
+                           horizontal=True, key="showcase_ranking", label_visibility="collapsed")
+    with category_col:
+        category = st.selectbox("Category", options=[None] + catalog.categories, key="showcase_category",
+                                format_func=lambda category: category or "All Categories",
+                                label_visibility="collapsed")
+    ranked = rankings[ranking][category]
+    pages = max(math.ceil(len(ranked) / SHOWCASE_PAGE_SIZE), 1)
+    with page_col:
+        page = st.number_input("Page", min_value=1, value=1, step=1, key="showcase_page",
+                               label_visibility="collapsed")
+    page = min(page, pages)
+    start = (page - 1) * SHOWCASE_PAGE_SIZE
+    items = catalog.products.iloc[ranked[start:start + SHOWCASE_PAGE_SIZE]]
+
+    # Display products in a grid; images are local thumbnails from
+    # assets/products/ (see stylenest.images). Cards below the fold load
+    # their image only when scrolled into view.
+    cols = st.columns(3)
+    for idx, item in enumerate(items.itertuples(index=False)):
+        name = html.escape(item.product)
+        with cols[idx % 3]:
+            st.markdown(f"""
+                <div style='background: rgba(30, 41, 59, 0.5); border-radius: 12px; padding: 1rem; 
+                            margin-bottom: 1rem; border: 1px solid #334155; text-align: center;'>
+                    <img src='{thumbnail(item.product)}' loading='lazy' decoding='async'
+                         width='{THUMB_SIZE[0]}' height='{THUMB_SIZE[1]}' alt='{name}'
+                         style='width: 100%; height: 300px; object-fit: cover; 
+                         border-radius: 8px; margin-bottom: 0.5rem;' />
+                    <h4 style='color: #f1f5f9; margin: 0.5rem 0; font-size: 1rem;'>{name}</h4>
+                    <p style='color: #6366f1; font-size: 1.1rem; font-weight: 600; margin: 0;'>${item.price:,.2f}</p>
+                    <p style='color: #94a3b8; font-size: 0.8rem; margin: 0.25rem 0 0;'>{html.escape(item.category)} · {item.sku}</p>
+                </div>
+            """, unsafe_allow_html=True)
+    if len(ranked):
+        st.caption(f"{start + 1:,}–{start + len(items):,} of {len(ranked):,} products · page {page} of {pages}")
+    else:
+        st.caption("No products in this category")
 
 st.markdown("</div>", unsafe_allow_html=True)
 
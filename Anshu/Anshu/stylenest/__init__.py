@@ -0,0 +1,4 @@
+"""
+StyleNest BI - Shared Modules
+Data access and helpers shared by the app entry point and the dashboard pages
+"""
@@ -0,0 +1,47 @@
+"""
+Versioned Result Cache
+Memoizes derived data by the version of the datasets it was computed from
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+
+def _key_part(value):
+    # Datasets are keyed by source name and version, not by identity, so a
+    # reload of an unchanged file still hits the cache.
+    version = getattr(value, "version", None)
+    if version is not None:
+        return ("dataset", value.name, version)
+    return value
+
+
+def cached_by_version(maxsize=8):
+    """Decorator caching results per (dataset versions, other arguments).
+
+    Results are shared by every session in the process and must be treated
+    as read-only by callers.
+    """
+    def decorator(func):
+        entries = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = tuple(_key_part(arg) for arg in args)
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    return entries[key]
+            value = func(*args)
+            with lock:
+                entries[key] = value
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,70 @@
+"""
+Campaign Analytics
+Per-campaign ROI, ROAS and CPA and cumulative spend curves from raw spend/revenue events
+"""
+
+import numpy as np
+
+from stylenest.cache import cached_by_version
+
+
+def campaign_metrics(totals):
+    """Add roi (%), roas and cpa columns to per-campaign spend/revenue/conversions totals.
+
+    Ratios with no spend or no conversions are left missing rather than infinite.
+    """
+    spend = totals["spend"].to_numpy(dtype=np.float64)
+    revenue = totals["revenue"].to_numpy(dtype=np.float64)
+    conversions = (totals["conversions"].to_numpy(dtype=np.float64) if "conversions" in totals
+                   else np.full(len(totals), np.nan))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        paid = np.where(spend > 0, spend, np.nan)
+        converted = np.where(conversions > 0, conversions, np.nan)
+        return totals.assign(
+            roi=((revenue - spend) / paid * 100).round(1),
+            roas=(revenue / paid).round(2),
+            cpa=(spend / converted).round(2),
+        )
+
+
+@cached_by_version()
+def campaign_stats(marketing):
+    """One row per campaign with spend, revenue, conversions, roi, roas and cpa.
+
+    Computed in one group-by over the campaign_events section, ordered by
+    campaign start date, when the source has one; otherwise from the
+    per-campaign totals in campaign_roi.
+    """
+    if "campaign_events" in marketing:
+        events = marketing.table("campaign_events")
+        totals = events.groupby("campaign", sort=False).agg(
+            start=("date", "min"),
+            end=("date", "max"),
+            spend=("spend", "sum"),
+            revenue=("revenue", "sum"),
+            conversions=("conversions", "sum"),
+        )
+        totals = totals.sort_values("start", kind="stable").reset_index()
+    else:
+        totals = marketing.table("campaign_roi").drop(columns="roi")
+    return campaign_metrics(totals)
+
+
+@cached_by_version()
+def spend_curve(marketing):
+    """Cumulative spend and revenue per day across all campaigns, or None without events."""
+    if "campaign_events" not in marketing:
+        return None
+    events = marketing.table("campaign_events")
+    daily = events.groupby("date")[["spend", "revenue"]].sum().sort_index()
+    return daily.cumsum().reset_index()
+
+
+@cached_by_version()
+def best_campaign(marketing):
+    """Campaign with the highest ROI, or the source's best_campaign when there are none."""
+    stats = campaign_stats(marketing)
+    roi = stats["roi"].to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(roi).all():
+        return marketing.scalars.get("best_campaign", "")
+    return str(stats["campaign"].iloc[int(np.nanargmax(roi))])
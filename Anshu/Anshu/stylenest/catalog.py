@@ -0,0 +1,145 @@
+"""
+Product Catalog
+Product metadata indexed by SKU, name and category, and precomputed showcase rankings
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+from stylenest.reorder import reorder_plan
+
+# Catalog columns attached to the Sales and Inventory product tables
+METADATA = ("sku", "category", "price")
+
+# Showcase ranking -> label
+SHOWCASE_RANKINGS = {"featured": "Featured", "top_selling": "Top Selling", "trending": "Trending"}
+
+
+class ProductCatalog:
+    """Catalog rows, one per SKU, with a hash index on product name and row lists per category.
+
+    Every lookup returns row positions, so tables from other sources gain
+    catalog columns by positional take instead of a merge.
+    """
+
+    def __init__(self, products):
+        products = products.drop_duplicates("sku").drop_duplicates("product").reset_index(drop=True)
+        codes, categories = pd.factorize(products["category"], sort=True)
+        self.products = products.assign(category=pd.Categorical.from_codes(codes, categories=categories))
+        self.categories = list(categories)
+        self._names = pd.Index(products["product"].to_numpy(dtype=object))
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+        self._by_category = {category: order[bounds[i]:bounds[i + 1]]
+                             for i, category in enumerate(self.categories)}
+
+    def __len__(self):
+        return len(self.products)
+
+    def positions(self, names):
+        """Row of each product name, -1 where it is not in the catalog."""
+        return self._names.get_indexer(np.asarray(names, dtype=object))
+
+    def in_category(self, category):
+        """Rows of one category, in catalog order."""
+        return self._by_category.get(category, np.empty(0, dtype=np.intp))
+
+    def describe(self, names, fields=METADATA):
+        """Catalog fields for each product name, missing where it is not in the catalog."""
+        positions = self.positions(names)
+        return pd.DataFrame({field: self.products[field].array.take(positions, allow_fill=True)
+                             for field in fields})
+
+
+def with_metadata(catalog, frame, column="product", fields=METADATA):
+    """frame with the catalog fields inserted after column."""
+    described = catalog.describe(frame[column], fields)
+    at = frame.columns.get_loc(column) + 1
+    frame = frame.copy(deep=False)
+    for offset, field in enumerate(fields):
+        frame.insert(at + offset, field, described[field].to_numpy())
+    return frame
+
+
+@cached_by_version()
+def product_catalog(catalog):
+    """ProductCatalog of the catalog source, built once per data version and shared by all pages."""
+    return ProductCatalog(catalog.table("products"))
+
+
+@cached_by_version()
+def sales_products(sales, catalog):
+    """product_performance with SKU, category and price from the catalog."""
+    return with_metadata(product_catalog(catalog), sales.table("product_performance"))
+
+
+@cached_by_version()
+def stock_products(inventory, catalog):
+    """The reorder plan's per-product rows with SKU, category and price from the catalog."""
+    return with_metadata(product_catalog(catalog), reorder_plan(inventory)["products"])
+
+
+def _scores(catalog, names, values):
+    """Catalog-aligned array of values for the named products, NaN elsewhere."""
+    scores = np.full(len(catalog), np.nan)
+    positions = catalog.positions(names)
+    found = positions >= 0
+    scores[positions[found]] = np.asarray(values, dtype=np.float64)[found]
+    return scores
+
+
+def _revenue(catalog, sales, inventory):
+    """Sales per product, or units sold times price for products without sales rows."""
+    performance = sales.table("product_performance")
+    revenue = _scores(catalog, performance["product"], performance["sales"])
+    stock = inventory.table("top_selling_products")
+    units = _scores(catalog, stock["product"], stock["units_sold"])
+    price = catalog.products["price"].to_numpy(dtype=np.float64)
+    return np.where(np.isnan(revenue), units * price, revenue)
+
+
+def _trend(catalog, sales):
+    """Sales growth from the previous month to the latest one, or None without a sales cube."""
+    if "sales_cube" not in sales:
+        return None
+    cube = sales.table("sales_cube")
+    months = np.sort(cube["month"].unique())[-2:]
+    if len(months) < 2:
+        return None
+    recent = cube[cube["month"].isin(months)]
+    monthly = recent.pivot_table(index="product", columns="month", values="sales", aggfunc="sum", fill_value=0)
+    growth = monthly[months[1]] - monthly[months[0]]
+    return _scores(catalog, growth.index, growth.to_numpy())
+
+
+@cached_by_version()
+def showcase_rankings(catalog, sales, inventory):
+    """Ranking -> category (None for all) -> catalog rows, best first.
+
+    Every (ranking, category) list is computed once per data version, so a
+    showcase query is a dict lookup and a slice. Only rankings with data
+    are included.
+    """
+    products = product_catalog(catalog)
+    orders = {}
+    if "featured" in products.products:
+        orders["featured"] = np.flatnonzero(products.products["featured"].to_numpy(dtype=bool, na_value=False))
+    scores = {"top_selling": _revenue(products, sales, inventory), "trending": _trend(products, sales)}
+    for ranking, score in scores.items():
+        if score is not None:
+            ranked = np.where(np.isnan(score), -np.inf, score)
+            orders[ranking] = np.argsort(-ranked, kind="stable")
+    rankings = {}
+    for ranking, order in orders.items():
+        if not len(order):
+            continue
+        # Rank of each catalog row; rows left out of the ranking sort last
+        rank = np.full(len(products), len(order))
+        rank[order] = np.arange(len(order))
+        rankings[ranking] = {None: order}
+        for category in products.categories:
+            rows = products.in_category(category)
+            rows = rows[rank[rows] < len(order)]
+            rankings[ranking][category] = rows[np.argsort(rank[rows], kind="stable")]
+    return rankings
@@ -0,0 +1,102 @@
+"""
+Chart Helpers
+Shared dark theme and a figure cache keyed by data version and filter state
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+THEME = "dark"
+
+# Traces with more points than this are drawn with WebGL instead of SVG
+WEBGL_THRESHOLD = int(os.environ.get("STYLENEST_WEBGL_THRESHOLD", "5000"))
+
+THEME_LAYOUT = {
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "font_color": "#94a3b8",
+}
+
+
+def apply_theme(fig, **layout):
+    """Apply the dashboard dark theme plus any chart-specific layout."""
+    fig.update_layout(**THEME_LAYOUT, **layout)
+    return fig
+
+
+def use_webgl(n_points):
+    return n_points > WEBGL_THRESHOLD
+
+
+def scatter_trace(**kwargs):
+    """go.Scatter, or go.Scattergl with the same styling when the trace is large."""
+    n_points = len(kwargs.get("x", kwargs.get("y", ())))
+    trace_type = go.Scattergl if use_webgl(n_points) else go.Scatter
+    return trace_type(**kwargs)
+
+
+def render_mode(n_points):
+    """render_mode argument for px.line / px.scatter."""
+    return "webgl" if use_webgl(n_points) else "svg"
+
+
+class FigureCache:
+    """LRU cache of built figures, bounded by entry count and serialized size.
+
+    Built figures are stored rather than their JSON: st.plotly_chart
+    re-validates figures passed as dicts, but only serializes Figure objects.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, fig):
+        size = len(pio.to_json(fig, validate=False))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            self._entries[key] = (fig, size)
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+figure_cache = FigureCache()
+
+
+def cached_figure(chart_id, version, build, filters=()):
+    """Return the figure for (chart_id, version, filters, theme), building it on a miss.
+
+    The returned figure is shared and must not be modified by the caller.
+    """
+    key = (chart_id, version, filters, THEME)
+    fig = figure_cache.get(key)
+    if fig is None:
+        fig = build()
+        figure_cache.put(key, fig)
+    return fig
@@ -0,0 +1,150 @@
+"""
+Cohort Retention
+Monthly customer cohorts and retention, accumulated chunk by chunk from order rows
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+
+# Month numbers (year * 12 + month - 1) fit in the low bits of an activity key
+MONTH_BITS = 15
+
+# Uncompacted activity keys tolerated before merging, at least
+COMPACT_KEYS = 1 << 20
+
+
+def month_numbers(dates):
+    """Month number of each date, for datetime64 values."""
+    months = dates.to_numpy(dtype="datetime64[M]").astype(np.int64)
+    # datetime64[M] counts months since 1970-01
+    return months + 1970 * 12
+
+
+def _unique(keys, kind=None):
+    """Sorted distinct keys; a stable sort merges already sorted runs cheaply."""
+    keys = np.sort(keys, kind=kind)
+    keep = np.empty(len(keys), dtype=bool)
+    keep[:1] = True
+    np.not_equal(keys[1:], keys[:-1], out=keep[1:])
+    return keys[keep]
+
+
+def grow(array, size, fill):
+    """array extended with fill to at least size, doubling to keep appends amortized O(1)."""
+    if size <= len(array):
+        return array
+    grown = np.full(max(size, 2 * len(array)), fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class CustomerCodes:
+    """Dense codes for customer ids, in order of first appearance, kept across chunks.
+
+    Per-customer arrays are indexed by code, so their size follows the number
+    of distinct customers, not the largest id, and ids may be of any hashable
+    type. Rows without an id get code -1.
+    """
+
+    def __init__(self):
+        self._codes = {}
+        self._ids = []
+
+    def __len__(self):
+        return len(self._ids)
+
+    def encode(self, customer_ids):
+        """Code of each id; only the chunk's distinct ids are looked up."""
+        local, uniques = pd.factorize(np.asarray(customer_ids))
+        lookup = np.empty(len(uniques) + 1, dtype=np.int64)
+        for i, customer in enumerate(uniques.tolist()):
+            code = self._codes.get(customer)
+            if code is None:
+                code = self._codes[customer] = len(self._ids)
+                self._ids.append(customer)
+            lookup[i] = code
+        # Missing ids are factorized to -1, which picks this last entry
+        lookup[-1] = -1
+        return lookup[local]
+
+    def ids(self, codes):
+        """Original ids of codes."""
+        return pd.Index(self._ids)[codes]
+
+
+class CohortAccumulator:
+    """Distinct active months per customer, merged across order chunks.
+
+    Each chunk is reduced to its unique (customer, month) keys. Those are
+    merged into one sorted array only once the pending keys outgrow it, so
+    total work stays O(n log n) while memory is bounded by the number of
+    distinct customer-months rather than by the number of orders.
+    Customers are codes from CustomerCodes.encode(); rows with code -1 are
+    skipped.
+    """
+
+    def __init__(self):
+        self._first = np.empty(0, dtype=np.int64)
+        self._keys = np.empty(0, dtype=np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def add(self, customers, months):
+        customers = np.asarray(customers, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        known = customers >= 0
+        customers, months = customers[known], months[known]
+        if not len(customers):
+            return
+        self._first = grow(self._first, int(customers.max()) + 1, np.iinfo(np.int64).max)
+        np.minimum.at(self._first, customers, months)
+        keys = _unique((customers << MONTH_BITS) | months)
+        self._pending.append(keys)
+        self._pending_size += len(keys)
+        if self._pending_size > max(len(self._keys), COMPACT_KEYS):
+            self._compact()
+
+    def _compact(self):
+        if self._pending:
+            self._keys = _unique(np.concatenate([self._keys] + self._pending), kind="stable")
+            self._pending = []
+            self._pending_size = 0
+
+    def result(self):
+        """Long-form cohort table: cohort month, months since first order, active customers."""
+        self._compact()
+        customers = self._keys >> MONTH_BITS
+        months = self._keys & ((1 << MONTH_BITS) - 1)
+        cohorts = self._first[customers]
+        periods = months - cohorts
+        if not len(cohorts):
+            return pd.DataFrame({"cohort": pd.Series(dtype="datetime64[ns]"),
+                                 "period": pd.Series(dtype="int64"), "customers": pd.Series(dtype="int64")})
+        base = int(cohorts.min())
+        span = int(periods.max()) + 1
+        counts = np.bincount((cohorts - base) * span + periods)
+        cells = np.flatnonzero(counts)
+        cohort_months = base + cells // span
+        return pd.DataFrame({
+            "cohort": pd.to_datetime({"year": cohort_months // 12, "month": cohort_months % 12 + 1, "day": 1})
+                        .astype("datetime64[ns]"),
+            "period": (cells % span).astype(np.int64),
+            "customers": counts[cells].astype(np.int64),
+        })
+
+
+@cached_by_version()
+def retention_matrix(sales):
+    """Cohort x months-since-first-order share of customers still ordering, or None.
+
+    Rows are cohorts (first order month), oldest first; column 0 is always
+    1.0. Built once per data version from the cohort_retention table.
+    """
+    if "cohort_retention" not in sales:
+        return None
+    cohorts = sales.table("cohort_retention")
+    counts = cohorts.pivot(index="cohort", columns="period", values="customers").sort_index()
+    sizes = counts[0].to_numpy(dtype=np.float64)
+    return counts.div(sizes, axis=0)
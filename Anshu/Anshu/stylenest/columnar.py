@@ -0,0 +1,82 @@
+"""
+Columnar Binary Cache
+Mirrors each data/*.json source as uncompressed Arrow IPC files that are
+memory-mapped on load, so worker processes share the OS page cache
+
+Build ahead of deployment with:  python -m stylenest.columnar
+"""
+
+import json
+import os
+import shutil
+
+import pyarrow as pa
+
+MANIFEST = "manifest.json"
+
+
+def _write_atomic(path, write):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_table(path, frame):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def store(cache_dir, name, version, scalars, tables):
+    """Write one source's tables and a manifest recording the source version."""
+    source_dir = cache_dir / name
+    if source_dir.exists():
+        shutil.rmtree(source_dir)
+    source_dir.mkdir(parents=True)
+    for table_name, frame in tables.items():
+        _write_atomic(source_dir / f"{table_name}.arrow",
+                      lambda tmp, frame=frame: _write_table(tmp, frame))
+    # The manifest goes last: a cache without one is never read
+    manifest = {"version": version, "scalars": scalars, "tables": list(tables)}
+    _write_atomic(source_dir / MANIFEST, lambda tmp: tmp.write_text(json.dumps(manifest)))
+
+
+def load(cache_dir, name, version):
+    """Return (scalars, tables) from the cache, or None if missing or stale.
+
+    Numeric and datetime columns are zero-copy, read-only views over the
+    memory-mapped file.
+    """
+    source_dir = cache_dir / name
+    try:
+        manifest = json.loads((source_dir / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != version:
+        return None
+    tables = {}
+    try:
+        for table_name in manifest["tables"]:
+            source = pa.memory_map(str(source_dir / f"{table_name}.arrow"), "r")
+            table = pa.ipc.open_file(source).read_all()
+            tables[table_name] = table.to_pandas(split_blocks=True)
+    except (OSError, pa.ArrowException):
+        return None
+    return manifest["scalars"], tables
+
+
+def build(names=None):
+    """Refresh the cache of every (or the given) source from its JSON files."""
+    from stylenest import data
+
+    built = []
+    for name in names or data.SOURCES:
+        dataset = data.get_dataset(name)
+        built.append((name, dataset.version))
+    return built
+
+
+if __name__ == "__main__":
+    for name, version in build():
+        print(f"{name}: {version}")
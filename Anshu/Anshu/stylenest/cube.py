@@ -0,0 +1,106 @@
+"""
+Sales Cube
+Region x category x product x month sales aggregates for drill-down charts
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+
+# Drill order, outermost first
+DIMENSIONS = ("region", "category", "product")
+MEASURES = ("sales", "units")
+
+
+def _encode(codes, sizes, length):
+    """Mixed-radix key of the leading codes; keys sort like the code tuples."""
+    key = np.zeros(length, dtype=np.int64)
+    for values, size in zip(codes, sizes):
+        key = key * size + values
+    return key
+
+
+class SalesCube:
+    """Pre-aggregated sales at every drill level, built once per data version.
+
+    frame has one row per (region, category, product, month). Each level is
+    rolled up once and sorted by its parent path, best seller first, so the
+    children of a path are one contiguous slice found by binary search and a
+    drill step never groups the underlying rows again. Monthly totals per
+    path are stored the same way.
+    """
+
+    def __init__(self, frame):
+        self.sizes = []
+        self.labels = []
+        self._lookup = []
+        codes = []
+        for dimension in DIMENSIONS:
+            values, labels = pd.factorize(frame[dimension], sort=True)
+            codes.append(values.astype(np.int64))
+            self.labels.append(np.asarray(labels, dtype=object))
+            self._lookup.append({label: code for code, label in enumerate(self.labels[-1])})
+            self.sizes.append(len(labels))
+        months, self.months = pd.factorize(frame["month"], sort=True)
+        measures = frame[list(MEASURES)].reset_index(drop=True)
+
+        # depth -> (parent keys, codes, measures) of the children at that depth
+        self._levels = []
+        # depth -> (path keys, measures) of the monthly totals of each path
+        self._trends = []
+        for depth in range(len(DIMENSIONS) + 1):
+            path = _encode(codes[:depth], self.sizes[:depth], len(frame))
+            if depth < len(DIMENSIONS):
+                key = path * self.sizes[depth] + codes[depth]
+                totals = measures.groupby(key).sum()
+                child = totals.index.to_numpy() % self.sizes[depth]
+                parent = totals.index.to_numpy() // self.sizes[depth]
+                order = np.lexsort((-totals["sales"].to_numpy(), parent))
+                self._levels.append((parent[order], child[order], totals.iloc[order].reset_index(drop=True)))
+            monthly = measures.groupby(path * len(self.months) + months).sum()
+            self._trends.append((monthly.index.to_numpy(), monthly))
+
+    def _path_key(self, path):
+        """Key of path, or None when one of its labels is not in the cube."""
+        codes = []
+        for lookup, label in zip(self._lookup, path):
+            code = lookup.get(label)
+            if code is None:
+                return None
+            codes.append(np.array([code], dtype=np.int64))
+        return int(_encode(codes, self.sizes[:len(path)], 1)[0])
+
+    def children(self, path=()):
+        """Totals of each child of path, best seller first; empty if path is unknown."""
+        depth = len(path)
+        dimension = DIMENSIONS[depth]
+        key = self._path_key(path)
+        parent, child, totals = self._levels[depth]
+        if key is None:
+            lo = hi = 0
+        else:
+            lo, hi = np.searchsorted(parent, [key, key + 1])
+        frame = totals.iloc[lo:hi].reset_index(drop=True)
+        frame.insert(0, dimension, pd.Series(self.labels[depth][child[lo:hi]], dtype="string"))
+        return frame
+
+    def trend(self, path=()):
+        """Monthly totals of path, oldest first."""
+        key = self._path_key(path)
+        keys, monthly = self._trends[len(path)]
+        if key is None:
+            lo = hi = 0
+        else:
+            lo, hi = np.searchsorted(keys, [key * len(self.months), (key + 1) * len(self.months)])
+        frame = monthly.iloc[lo:hi].reset_index(drop=True)
+        frame.insert(0, "month", self.months[keys[lo:hi] % len(self.months)])
+        return frame
+
+
+@cached_by_version()
+def sales_cube(sales):
+    """SalesCube of the sales source, or None when it has no order-level breakdown."""
+    if "sales_cube" not in sales:
+        return None
+    return SalesCube(sales.table("sales_cube"))
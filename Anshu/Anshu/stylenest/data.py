@@ -0,0 +1,277 @@
+"""
+Shared Data Access Layer
+Loads the data/*.json sources once per process into typed, columnar tables
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from stylenest import columnar
+from stylenest.ingest import OrderStream
+
+# Pages receive shallow copies of the cached tables. With copy-on-write a page
+# can add or overwrite columns on its copy without touching the shared table.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# STYLENEST_DATA_DIR points the dashboards at another export, e.g. a synthetic one
+DATA_DIR = Path(os.environ.get("STYLENEST_DATA_DIR", Path(__file__).parent.parent / "data"))
+
+# Memory-mapped Arrow mirror of the JSON sources, see stylenest.columnar
+CACHE_DIRNAME = ".cache"
+
+SOURCES = ("sales", "inventory", "marketing", "customers", "catalog")
+
+# Optional line-delimited order exports. When present, the file is streamed
+# and its aggregates replace the matching sections of the JSON document.
+ORDER_STREAMS = {"sales": "sales_orders.ndjson"}
+
+# Column dtypes for every list-of-records section of the JSON sources
+SCHEMAS = {
+    "sales": {
+        "monthly_sales": {"month": "string", "revenue": "int64", "orders": "int64"},
+        "category_revenue": {"category": "string", "revenue": "int64"},
+        "regional_growth": {"region": "string", "customers": "int64", "growth": "float64"},
+        "daily_sales": {"date": "datetime64[ns]", "sales": "int64", "units": "int64"},
+        "region_sales": {"region": "string", "sales": "int64"},
+        "product_performance": {"product": "string", "sales": "int64", "units": "int64"},
+        # Active customers per first-order month and months since; see stylenest.cohorts
+        "cohort_retention": {"cohort": "datetime64[ns]", "period": "int64", "customers": "int64"},
+        # One row per region, category, product and month; see stylenest.cube
+        "sales_cube": {
+            "region": "string", "category": "string", "product": "string",
+            "month": "datetime64[ns]", "sales": "int64", "units": "int64",
+        },
+    },
+    "inventory": {
+        "category_stock": {"category": "string", "stock": "int64", "threshold": "int64"},
+        "top_selling_products": {
+            "product": "string", "units_sold": "int64", "stock": "int64", "status": "string",
+        },
+        "supplier_comparison": {
+            "supplier": "string", "delivery_time": "int64", "quality_score": "int64",
+            "price_score": "int64", "total_score": "int64",
+        },
+        "low_stock_items": {"product": "string", "current_stock": "int64", "reorder_level": "int64"},
+    },
+    "marketing": {
+        "social_media_engagement": {"platform": "string", "engagement": "int64", "followers": "int64"},
+        "campaign_roi": {"campaign": "string", "spend": "int64", "revenue": "int64", "roi": "float64"},
+        # Daily spend and attributed revenue per campaign; see stylenest.campaigns
+        "campaign_events": {
+            "date": "datetime64[ns]", "campaign": "string", "spend": "int64",
+            "revenue": "int64", "conversions": "int64",
+        },
+        "customer_demographics": {"age_group": "string", "percentage": "float64", "count": "int64"},
+        "monthly_visits": {"month": "string", "visits": "int64"},
+    },
+    "customers": {
+        "customer_segments": {"segment": "string", "count": "int64", "percentage": "float64"},
+        "customer_acquisition": {"month": "string", "new_customers": "int64"},
+        "customer_satisfaction_trend": {"month": "string", "score": "float64"},
+    },
+    # Product metadata shared by every page; see stylenest.catalog
+    "catalog": {
+        "products": {
+            "sku": "string", "product": "string", "category": "string",
+            "price": "float64", "featured": "bool",
+        },
+    },
+}
+
+
+class Dataset:
+    """Scalar fields and typed tables parsed from one JSON source.
+
+    pending, if given, returns more tables; it is called on the first table
+    access, so readers of scalars and running values never pay for them.
+    """
+
+    def __init__(self, name, scalars, tables, version="", running=None, rankings=None, pending=None):
+        self.name = name
+        self.scalars = scalars
+        self._tables = tables
+        self.version = version
+        # RunningKPIs snapshot when the source is fed by an order stream
+        self.running = running
+        # Top products per metric, maintained while an order stream is read
+        self.rankings = rankings
+        self._pending = pending
+        self._pending_lock = threading.Lock()
+
+    def __getitem__(self, key):
+        return self.scalars[key]
+
+    def __contains__(self, key):
+        return key in self.scalars or key in self.tables
+
+    @property
+    def tables(self):
+        """Table name -> DataFrame, building the pending tables on first use."""
+        if self._pending is not None:
+            with self._pending_lock:
+                if self._pending is not None:
+                    self._tables = {**self._tables, **self._pending()}
+                    self._pending = None
+        return self._tables
+
+    @property
+    def table_names(self):
+        return tuple(self.tables)
+
+    def table(self, name):
+        """Return a read-only view of a table; columns added by the caller stay local."""
+        return self.tables[name].copy(deep=False)
+
+
+def _build_table(records, schema):
+    """Build one typed DataFrame from a list of records."""
+    frame = pd.DataFrame.from_records(records, columns=list(schema))
+    return frame.astype(schema)
+
+
+def parse_source(name, raw, version=""):
+    """Split a decoded JSON document into scalar fields and typed tables."""
+    schemas = SCHEMAS.get(name, {})
+    scalars = {}
+    tables = {}
+    for key, value in raw.items():
+        if isinstance(value, list) and (not value or isinstance(value[0], dict)):
+            schema = schemas.get(key)
+            tables[key] = _build_table(value, schema) if schema else pd.DataFrame(value)
+        else:
+            scalars[key] = value
+    return Dataset(name, scalars, tables, version)
+
+
+def source_path(name):
+    return DATA_DIR / f"{name}.json"
+
+
+def _source_files(name):
+    files = [source_path(name)]
+    stream = ORDER_STREAMS.get(name)
+    if stream and (DATA_DIR / stream).exists():
+        files.append(DATA_DIR / stream)
+    return files
+
+
+def _signature(files):
+    """Identify one version of a source by path, modification time and size."""
+    signature = []
+    for path in files:
+        stat = path.stat()
+        signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _version(signature):
+    return hashlib.md5(repr(signature).encode()).hexdigest()[:12]
+
+
+def _read_source(name, files, signature):
+    version = _version(signature)
+    cache_dir = DATA_DIR / CACHE_DIRNAME
+    cached = columnar.load(cache_dir, name, version)
+    if cached is not None:
+        scalars, tables = cached
+        return Dataset(name, scalars, tables, version)
+
+    if len(files) == 1:
+        with open(files[0], "r") as f:
+            dataset = parse_source(name, json.load(f), version)
+    else:
+        dataset = _parse_base(name, files[0], signature[0], version)
+        stream = _order_stream(files[1])
+        appended = stream.offset > 0
+        stream.poll()
+        dataset.scalars.update(stream.accumulator.scalars())
+        # Tables are rebuilt only if a page reads them. A dataset superseded
+        # before that builds them from the stream's later state; get_dataset
+        # no longer returns it, so only runs already holding it see them.
+        dataset._pending = stream.accumulator.tables
+        dataset.running = stream.running.snapshot()
+        dataset.rankings = stream.accumulator.rankings()
+        if appended:
+            # Rewriting the columnar cache would make every appended order
+            # cost a full write; it is refreshed on the next full read.
+            return dataset
+    try:
+        columnar.store(cache_dir, name, version, dataset.scalars, dataset.tables)
+    except (OSError, TypeError, ValueError):
+        # Read-only deployments and tables Arrow cannot represent fall back
+        # to parsing the JSON on every reload.
+        pass
+    return dataset
+
+
+# path -> (signature, scalars, tables) of the JSON document under an order
+# stream. Appending orders changes the source version but not the document,
+# so it is parsed again only when the document itself changes.
+_bases = {}
+
+
+def _parse_base(name, path, file_signature, version):
+    entry = _bases.get(path)
+    if entry is None or entry[0] != file_signature:
+        with open(path, "r") as f:
+            base = parse_source(name, json.load(f))
+        entry = _bases[path] = (file_signature, base.scalars, base._tables)
+    return Dataset(name, dict(entry[1]), dict(entry[2]), version)
+
+
+# path -> OrderStream. Kept across versions so that orders appended to an
+# export are ingested without re-reading the lines already seen.
+_streams = {}
+
+
+def _order_stream(path):
+    stream = _streams.get(path)
+    if stream is None:
+        stream = _streams[path] = OrderStream(path)
+    return stream
+
+
+# name -> (signature, Dataset). Shared by every session in the process, so a
+# reload triggered by one page is seen by all pages on their next run.
+_datasets = {}
+_lock = threading.Lock()
+
+
+def get_dataset(name):
+    """Return the current Dataset for one of the data/*.json sources.
+
+    Each call stats the source files; only a source whose mtime or size
+    changed since it was last parsed is read again.
+    """
+    if name not in SOURCES:
+        raise KeyError(f"Unknown data source: {name}")
+    files = _source_files(name)
+    signature = _signature(files)
+    entry = _datasets.get(name)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    with _lock:
+        entry = _datasets.get(name)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        try:
+            dataset = _read_source(name, files, signature)
+        except ValueError:
+            # The export is probably still being written; keep serving the
+            # previous version and retry on the next call.
+            if entry is None:
+                raise
+            return entry[1]
+        _datasets[name] = (signature, dataset)
+        return dataset
+
+
+def data_version(*names):
+    """Combined version of the given sources (all sources by default)."""
+    return "|".join(get_dataset(name).version for name in names or SOURCES)
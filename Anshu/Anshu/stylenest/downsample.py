@@ -0,0 +1,75 @@
+"""
+Time-series Downsampling
+Reduces long series to a pixel-sized point budget before figures are built
+"""
+
+import numpy as np
+
+# Roughly two points per horizontal pixel of a half-width chart
+POINT_BUDGET = 1000
+
+
+def _numeric(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return values.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _numeric(x)
+    y = _numeric(y)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2]
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n_out):
+    """Indices of the minimum and maximum of each of n_out / 2 buckets."""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    y = _numeric(y)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    picks = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        bucket = y[start:end]
+        picks.append(start + int(bucket.argmin()))
+        picks.append(start + int(bucket.argmax()))
+    return np.unique(picks)
+
+
+def downsample(frame, x, y, n_out=POINT_BUDGET, window=None, method="lttb"):
+    """Rows of frame (optionally the positional window (start, stop)) reduced to about n_out.
+
+    Positions are chosen from column y, so every other column of a kept row
+    stays aligned with it.
+    """
+    if window is not None:
+        frame = frame.iloc[window[0]:window[1]]
+    if len(frame) <= n_out:
+        return frame
+    if method == "minmax":
+        indices = minmax_indices(frame[y].to_numpy(), n_out)
+    elif x is None:
+        indices = lttb_indices(np.arange(len(frame)), frame[y].to_numpy(), n_out)
+    else:
+        indices = lttb_indices(frame[x].to_numpy(), frame[y].to_numpy(), n_out)
+    return frame.iloc[indices]
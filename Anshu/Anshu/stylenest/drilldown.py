@@ -0,0 +1,102 @@
+"""
+Drill-Down Charts
+Bar charts over the sales cube that drill from region to category to product on click
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from stylenest.charts import apply_theme, cached_figure
+from stylenest.cube import DIMENSIONS
+
+# Children shown per level, best sellers first
+DRILL_TOP = 20
+
+PLURALS = {"region": "regions", "category": "categories", "product": "products"}
+
+
+def drill_figure(children, dimension):
+    fig = px.bar(
+        children,
+        x=dimension,
+        y='sales',
+        title="",
+        labels={'sales': 'Sales ($)', dimension: dimension.title()},
+        color='sales',
+        color_continuous_scale='plasma',
+        text='sales'
+    )
+    fig.update_traces(
+        texttemplate='$%{text:,.0f}',
+        textposition='outside'
+    )
+    apply_theme(
+        fig,
+        xaxis=dict(gridcolor='#334155'),
+        yaxis=dict(gridcolor='#334155'),
+        showlegend=False
+    )
+    return fig
+
+
+def trend_figure(trend):
+    fig = px.line(trend, x='month', y='sales', labels={'sales': 'Sales ($)', 'month': ''})
+    fig.update_traces(mode='lines+markers', line=dict(color='#6366f1', width=3))
+    apply_theme(
+        fig,
+        height=220,
+        margin=dict(t=10, b=10),
+        xaxis=dict(gridcolor='#334155'),
+        yaxis=dict(gridcolor='#334155')
+    )
+    return fig
+
+
+def _set_path(path_key, path):
+    st.session_state[path_key] = path
+
+
+def _drill_into(path_key, chart_key, path):
+    points = st.session_state[chart_key].selection.points
+    if points:
+        st.session_state[path_key] = path + (str(points[0]["x"]),)
+
+
+def drill_down(cube, key, version):
+    """Render a click-to-drill chart over a SalesCube.
+
+    The drill path lives in session state under f"{key}_path". Each level is
+    one slice of the pre-built cube, and its figure is cached per data
+    version and path.
+    """
+    path_key = f"{key}_path"
+    path = tuple(st.session_state.get(path_key, ()))
+    children = cube.children(path)
+    if path and children.empty:
+        # The path no longer exists in reloaded data
+        path = ()
+        st.session_state[path_key] = path
+        children = cube.children(path)
+    dimension = DIMENSIONS[len(path)]
+
+    crumbs_col, up_col = st.columns([5, 1])
+    crumbs_col.caption(" › ".join((f"All {PLURALS[DIMENSIONS[0]]}",) + path))
+    if path:
+        up_col.button("⬆ Up", key=f"{key}_up", on_click=_set_path, args=(path_key, path[:-1]))
+
+    fig = cached_figure(f"drill/{key}", version,
+                        lambda: drill_figure(children.head(DRILL_TOP), dimension), (path,))
+    chart_key = f"{key}_chart_{'/'.join(path)}"
+    if len(path) + 1 < len(DIMENSIONS):
+        on_select = lambda: _drill_into(path_key, chart_key, path)
+        st.caption(f"Click a bar to see its {PLURALS[DIMENSIONS[len(path) + 1]]}")
+    else:
+        on_select = "ignore"
+    st.plotly_chart(fig, use_container_width=True, key=chart_key, on_select=on_select,
+                    selection_mode="points")
+    if len(children) > DRILL_TOP:
+        st.caption(f"Top {DRILL_TOP} of {len(children):,} {PLURALS[dimension]}")
+
+    if path:
+        fig = cached_figure(f"drill/{key}/trend", version, lambda: trend_figure(cube.trend(path)), (path,))
+        st.plotly_chart(fig, use_container_width=True, key=f"{key}_trend")
@@ -0,0 +1,202 @@
+"""
+Product Images
+Resizes local product images once into content-hashed WebP thumbnails
+served as static files, so pages never send full-size or remote images.
+Photos only listed by URL in assets/products/sources.json show a placeholder
+until fetched.
+
+Download the photos listed in assets/products/sources.json with:  python -m stylenest.images --fetch
+Build the thumbnails of assets/products/ ahead of deployment with:  python -m stylenest.images
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+ROOT = Path(__file__).parent.parent
+
+# Source images, named after the product: "Denim Jacket" -> denim-jacket.jpg
+ASSETS_DIR = Path(os.environ.get("STYLENEST_ASSETS_DIR", ROOT / "assets" / "products"))
+SOURCE_SUFFIXES = (".webp", ".jpg", ".jpeg", ".png")
+
+# Product name -> original photo URL, downloaded into ASSETS_DIR by fetch()
+SOURCES_MANIFEST = "sources.json"
+
+# Streamlit serves ROOT/static at app/static when server.enableStaticServing
+# is on (see .streamlit/config.toml). Thumbnail names carry a hash of their
+# content, so a URL never changes meaning and browsers can keep it cached.
+STATIC_DIR = ROOT / "static"
+STATIC_URL = "app/static"
+THUMBS_DIRNAME = "thumbs"
+
+THUMB_SIZE = (400, 500)
+WEBP_QUALITY = 80
+
+# Part of every thumbnail hash; bump it when _render_source or
+# _render_placeholder changes so browsers fetch the new images
+RENDER_VERSION = 1
+
+# Placeholder card colors (top, bottom) for products without a source image
+PLACEHOLDER_COLORS = [
+    ("#6366f1", "#1e1b4b"), ("#8b5cf6", "#2e1065"), ("#ec4899", "#500724"),
+    ("#10b981", "#022c22"), ("#f59e0b", "#451a03"), ("#0ea5e9", "#082f49"),
+]
+
+
+def slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def source_image(name):
+    """Path of the source image for a product name, or None."""
+    stem = slug(name)
+    for suffix in SOURCE_SUFFIXES:
+        path = ASSETS_DIR / f"{stem}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def photo_urls():
+    """Product name -> original photo URL from the sources manifest."""
+    path = ASSETS_DIR / SOURCES_MANIFEST
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _render_source(path, size):
+    with Image.open(path) as image:
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        return ImageOps.fit(image, size, Image.Resampling.LANCZOS)
+
+
+def _render_placeholder(name, size):
+    """Vertical gradient with the product's initials, for products without an image."""
+    digest = hashlib.md5(name.encode()).digest()
+    top, bottom = (Image.new("RGB", (1, 1), color).getpixel((0, 0))
+                   for color in PLACEHOLDER_COLORS[digest[0] % len(PLACEHOLDER_COLORS)])
+    width, height = size
+    gradient = Image.linear_gradient("L").resize(size)
+    image = Image.composite(Image.new("RGB", size, bottom), Image.new("RGB", size, top), gradient)
+    initials = "".join(word[0] for word in name.split()[:2]).upper() or "?"
+    font = ImageFont.load_default(size=height // 5)
+    ImageDraw.Draw(image).text((width / 2, height / 2), initials, font=font, anchor="mm",
+                               fill=(241, 245, 249))
+    return image
+
+
+# (source signature, size) -> content digest, so unchanged sources are not re-hashed
+_digests = {}
+# Thumbnail file name -> data URI, when static/ cannot be written
+_inline = {}
+_lock = threading.Lock()
+
+
+def _digest(name, source, size):
+    if source is None:
+        key = ("placeholder", name, size)
+    else:
+        stat = source.stat()
+        key = (str(source), stat.st_mtime_ns, stat.st_size, size)
+    digest = _digests.get(key)
+    if digest is None:
+        content = source.read_bytes() if source is not None else f"placeholder:{name}".encode()
+        digest = hashlib.sha256(content + repr((size, WEBP_QUALITY, RENDER_VERSION)).encode()).hexdigest()[:12]
+        with _lock:
+            _digests[key] = digest
+    return digest
+
+
+def _encode(image):
+    buffer = io.BytesIO()
+    image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+    return buffer.getvalue()
+
+
+def _write(target, data):
+    """Write data to target through a temporary file, so readers never see a partial image."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def thumbnail(name, size=THUMB_SIZE):
+    """URL of the product's WebP thumbnail, building it on first use.
+
+    A product without a local image gets a generated placeholder; remote
+    photos are never linked, only downloaded by fetch(). Where static/ is
+    read-only the thumbnail is inlined as a data URI, encoded once per
+    process.
+    """
+    source = source_image(name)
+    filename = f"{slug(name) or 'product'}-{size[0]}x{size[1]}.{_digest(name, source, size)}.webp"
+    target = STATIC_DIR / THUMBS_DIRNAME / filename
+    if target.exists():
+        return f"{STATIC_URL}/{THUMBS_DIRNAME}/{filename}"
+    inline = _inline.get(filename)
+    if inline is not None:
+        return inline
+    image = _render_source(source, size) if source is not None else _render_placeholder(name, size)
+    data = _encode(image)
+    try:
+        _write(target, data)
+    except OSError:
+        # Read-only deployments serve the image inline instead
+        inline = "data:image/webp;base64," + base64.b64encode(data).decode()
+        with _lock:
+            _inline[filename] = inline
+        return inline
+    return f"{STATIC_URL}/{THUMBS_DIRNAME}/{filename}"
+
+
+def fetch():
+    """Download the manifest's photos that are not in ASSETS_DIR yet; returns their paths."""
+    fetched = []
+    for name, url in photo_urls().items():
+        if source_image(name) is not None:
+            continue
+        with urllib.request.urlopen(url, timeout=30) as response:
+            data = response.read()
+        with Image.open(io.BytesIO(data)) as image:
+            suffix = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}.get(image.format, ".jpg")
+        path = ASSETS_DIR / f"{slug(name)}{suffix}"
+        _write(path, data)
+        fetched.append(path)
+    return fetched
+
+
+def build():
+    """Build the thumbnails of every source image; returns their URLs."""
+    paths = sorted(path for path in ASSETS_DIR.glob("*") if path.suffix in SOURCE_SUFFIXES)
+    return [thumbnail(path.stem) for path in paths]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fetch", action="store_true",
+                        help=f"first download the photos listed in {SOURCES_MANIFEST}")
+    args = parser.parse_args()
+    if args.fetch:
+        for path in fetch():
+            print(path)
+    for url in build():
+        print(url)
@@ -0,0 +1,256 @@
+"""
+Streaming Sales Ingestion
+Aggregates line-delimited order exports chunk by chunk into the sales tables
+"""
+
+import io
+import json
+import os
+
+import pandas as pd
+
+from stylenest.cohorts import CohortAccumulator, CustomerCodes, month_numbers
+from stylenest.cube import DIMENSIONS as CUBE_DIMENSIONS
+from stylenest.ranking import StreamingTopK
+from stylenest.rfm import RFMAccumulator
+from stylenest.running import RunningKPIs
+
+# Orders parsed per chunk; memory use is bounded by this and by the number of
+# distinct days, months, products, regions, categories and customer-months,
+# not by file size.
+CHUNK_ROWS = 200_000
+
+# Bytes remembered before the read offset to tell an append from a rewrite
+TAIL_BYTES = 256
+
+# Bytes read from the export per step while following it
+BLOCK_BYTES = 64 * 2**20
+
+
+def iter_order_chunks(source, chunk_rows=CHUNK_ROWS):
+    """Yield DataFrames of at most chunk_rows orders from NDJSON, a path or a binary file.
+
+    Each line is one order, e.g.
+    {"date": "2024-01-01", "sales": 49.99, "units": 1, "product": "Smart Watch",
+     "region": "North", "category": "Electronics"}
+
+    An optional "cost" field adds a per-product margin, and an optional
+    "customer_id" adds monthly cohort retention and RFM segments; orders
+    without one count everywhere else.
+    """
+    with pd.read_json(source, lines=True, chunksize=chunk_rows, dtype=False,
+                      convert_dates=False) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+class SalesAccumulator:
+    """Running sums over order chunks in the shape of the sales.json sections."""
+
+    def __init__(self):
+        self.orders = 0
+        self.revenue = 0.0
+        self._parts = {}
+        self._rankings = {}
+        self._customers = None
+        self._cohorts = None
+        self._rfm = None
+
+    def _merge(self, key, part):
+        previous = self._parts.get(key)
+        self._parts[key] = part if previous is None else previous.add(part, fill_value=0)
+
+    def add(self, chunk):
+        if chunk.empty:
+            return
+        dates = pd.to_datetime(chunk["date"])
+        months = dates.dt.to_period("M")
+        amounts = chunk[["sales", "units"]]
+        self.orders += len(chunk)
+        self.revenue += float(amounts["sales"].sum())
+
+        self._merge("daily", amounts.groupby(dates.dt.normalize()).sum())
+        monthly = chunk["sales"].groupby(months)
+        self._merge("monthly", pd.DataFrame({"revenue": monthly.sum(), "orders": monthly.size()}))
+        if "product" in chunk:
+            columns = ["sales", "units", "cost"] if "cost" in chunk else ["sales", "units"]
+            part = chunk[columns].groupby(chunk["product"]).sum()
+            self._merge("product", part)
+            self._rank(part)
+        if "region" in chunk:
+            self._merge("region", chunk["sales"].groupby(chunk["region"]).sum())
+        if "category" in chunk:
+            self._merge("category", chunk["sales"].groupby(chunk["category"]).sum())
+        if all(dimension in chunk for dimension in CUBE_DIMENSIONS):
+            keys = [chunk[dimension] for dimension in CUBE_DIMENSIONS] + [months.rename("month")]
+            self._merge("cube", amounts.groupby(keys).sum())
+        if "customer_id" in chunk:
+            if self._cohorts is None:
+                self._customers = CustomerCodes()
+                self._cohorts, self._rfm = CohortAccumulator(), RFMAccumulator(self._customers)
+            customers = self._customers.encode(chunk["customer_id"].to_numpy())
+            self._cohorts.add(customers, month_numbers(dates))
+            self._rfm.add(customers, dates.to_numpy(dtype="datetime64[D]").astype("int64"),
+                          amounts["sales"].to_numpy())
+
+    def _rank(self, part):
+        """Update the top products by each metric with the products in one chunk."""
+        totals = self._parts["product"]
+        for metric in ("sales", "units", "margin"):
+            if metric == "margin":
+                if "cost" not in totals:
+                    continue
+                values, changes = totals["sales"] - totals["cost"], part["sales"] - part.get("cost", 0)
+            else:
+                values, changes = totals[metric], part[metric]
+            ranking = self._rankings.setdefault(metric, StreamingTopK())
+            ranking.update(values, part.index, decreased=bool((changes < 0).any()))
+
+    def rankings(self):
+        """Top products per metric, as product_performance rows, best first."""
+        product = self._parts.get("product")
+        return {metric: _product_table(product.loc[ranking.keys])
+                for metric, ranking in self._rankings.items()}
+
+    def result(self):
+        """Return (scalars, tables) that replace the matching sales.json fields."""
+        return self.scalars(), self.tables()
+
+    def scalars(self):
+        return {"total_revenue": round(self.revenue), "total_orders": self.orders}
+
+    def tables(self):
+        """Sales tables, rebuilt from the accumulated totals on each call."""
+        tables = {}
+        parts = self._parts
+        if "daily" in parts:
+            daily = parts["daily"].sort_index()
+            tables["daily_sales"] = pd.DataFrame({
+                "date": daily.index.astype("datetime64[ns]"),
+                "sales": daily["sales"].round().astype("int64").values,
+                "units": daily["units"].astype("int64").values,
+            })
+        if "monthly" in parts:
+            monthly = parts["monthly"].sort_index()
+            tables["monthly_sales"] = pd.DataFrame({
+                "month": pd.Series(monthly.index.strftime("%b %Y"), dtype="string"),
+                "revenue": monthly["revenue"].round().astype("int64").values,
+                "orders": monthly["orders"].astype("int64").values,
+            })
+        if "product" in parts:
+            # Left unsorted; rankings are maintained separately
+            tables["product_performance"] = _product_table(parts["product"])
+        for key, table, label, value in (("region", "region_sales", "region", "sales"),
+                                         ("category", "category_revenue", "category", "revenue")):
+            if key in parts:
+                series = parts[key].sort_values(ascending=False)
+                tables[table] = pd.DataFrame({
+                    label: pd.Series(series.index, dtype="string"),
+                    value: series.round().astype("int64").values,
+                })
+        if self._cohorts is not None:
+            tables["cohort_retention"] = self._cohorts.result()
+            tables["customer_rfm"] = self._rfm.result()
+        if "cube" in parts:
+            cube = parts["cube"].reset_index()
+            tables["sales_cube"] = pd.DataFrame({
+                **{dimension: cube[dimension].astype("string") for dimension in CUBE_DIMENSIONS},
+                "month": cube["month"].dt.to_timestamp().astype("datetime64[ns]"),
+                "sales": cube["sales"].round().astype("int64"),
+                "units": cube["units"].astype("int64"),
+            })
+        return tables
+
+
+def _product_table(product):
+    table = pd.DataFrame({
+        "product": pd.Series(product.index, dtype="string"),
+        "sales": product["sales"].round().astype("int64").values,
+        "units": product["units"].astype("int64").values,
+    })
+    if "cost" in product:
+        table["margin"] = (product["sales"] - product["cost"]).round().astype("int64").values
+    return table
+
+
+class OrderStream:
+    """Follows an append-only NDJSON export, parsing only the lines added since the last poll.
+
+    The accumulator and running KPIs keep their state between polls, so
+    lines already ingested are never parsed again. Merging new orders still
+    touches every distinct day, product and cube cell of the new lines, and
+    rebuilding the sales tables touches all of them, so a refresh grows with
+    those totals, not with the number of orders in the file. A file that
+    shrank or whose bytes before the last offset changed was rewritten, and
+    is read again from the start.
+    """
+
+    def __init__(self, path, chunk_rows=CHUNK_ROWS):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self._reset()
+
+    def _reset(self):
+        self.offset = 0
+        self._tail = b""
+        self.accumulator = SalesAccumulator()
+        self.running = RunningKPIs()
+
+    def _rewritten(self, f, size):
+        if size < self.offset:
+            return True
+        f.seek(self.offset - len(self._tail))
+        return f.read(len(self._tail)) != self._tail
+
+    def poll(self):
+        """Ingest complete lines appended since the last poll; return how many orders were added."""
+        added = 0
+        with open(self.path, "rb") as f:
+            if self._rewritten(f, os.fstat(f.fileno()).st_size):
+                self._reset()
+            f.seek(self.offset)
+            pending = b""
+            while True:
+                block = f.read(BLOCK_BYTES)
+                if not block:
+                    break
+                block = pending + block
+                # A trailing partial line waits for the next block or poll
+                end = block.rfind(b"\n") + 1
+                pending = block[end:]
+                if end:
+                    added += self._consume(block[:end])
+        # The export may simply end without a newline. A line still being
+        # written is not valid JSON yet, and a complete object cannot be the
+        # start of a longer line, so the last line is taken once it parses.
+        # Lines appended later start with its newline, which is skipped.
+        if _complete_line(pending):
+            added += self._consume(pending)
+        return added
+
+    def _consume(self, lines):
+        try:
+            added = self._ingest(lines)
+        except ValueError:
+            # Chunks before the bad line were already counted
+            self._reset()
+            raise
+        self.offset += len(lines)
+        self._tail = (self._tail + lines)[-TAIL_BYTES:]
+        return added
+
+    def _ingest(self, lines):
+        added = 0
+        for chunk in iter_order_chunks(io.BytesIO(lines), self.chunk_rows):
+            self.accumulator.add(chunk)
+            self.running.extend(chunk)
+            added += len(chunk)
+        return added
+
+
+def _complete_line(line):
+    """Whether line is one whole JSON object."""
+    try:
+        return isinstance(json.loads(line), dict)
+    except ValueError:
+        return False
@@ -0,0 +1,110 @@
+"""
+KPI Pre-aggregation
+Computes the KPI card values of every dashboard once per data version
+"""
+
+import numpy as np
+
+from stylenest.cache import cached_by_version
+from stylenest.campaigns import best_campaign
+from stylenest.rfm import segment_counts
+from stylenest.timeindex import daily_sales_index
+
+
+# Sales rollup -> pandas resample frequency; daily rows are used as they are
+ROLLUPS = {"daily": None, "weekly": "W", "monthly": "MS"}
+
+
+def _mean(values):
+    return float(values.mean()) if len(values) else 0.0
+
+
+@cached_by_version()
+def sales_rollups(sales, window=None):
+    """Daily, weekly and monthly sales/units totals over the (lo, hi) window of days, or all days."""
+    index = daily_sales_index(sales)
+    lo, hi = window or (0, len(index))
+    return {name: index.slice(lo, hi) if freq is None else index.rollup(freq, lo, hi)
+            for name, freq in ROLLUPS.items()}
+
+
+@cached_by_version()
+def ceo_kpis(sales, window=None):
+    """Headline KPIs; revenue and units are daily sales totals over the (lo, hi) window of days, or all days."""
+    index = daily_sales_index(sales)
+    lo, hi = window or (0, len(index))
+    kpis = {
+        "total_revenue": index.total("sales", lo, hi),
+        "total_units": index.total("units", lo, hi),
+        "profit_margin": sales["profit_margin"],
+        "total_orders": sales["total_orders"],
+        "customer_satisfaction": sales["customer_satisfaction"],
+    }
+    if sales.running is not None:
+        kpis["total_orders"] = sales.running["orders"]
+    return kpis
+
+
+@cached_by_version()
+def marketing_kpis(marketing):
+    return {
+        "website_visits": marketing["website_visits"],
+        "conversion_rate": marketing["conversion_rate"],
+        "ad_spend": marketing["ad_spend"],
+        "best_campaign": best_campaign(marketing),
+    }
+
+
+@cached_by_version()
+def inventory_kpis(inventory):
+    return {
+        "stock_available": inventory["stock_available"],
+        "inventory_turnover_ratio": inventory["inventory_turnover_ratio"],
+        "supplier_performance_score": inventory["supplier_performance_score"],
+    }
+
+
+@cached_by_version()
+def sales_kpis(sales, customers, window=None):
+    """Sales card values; averages and trailing totals cover the (lo, hi) window of days if given.
+
+    Order streams keep the all-days values up to date as lines arrive;
+    otherwise they come from the prefix sums of the daily sales index.
+    """
+    if window is None and sales.running is not None:
+        values = {key: sales.running[key] for key in ("daily_avg", "daily_units", "sales_7d", "units_30d")}
+    else:
+        index = daily_sales_index(sales)
+        lo, hi = window or (0, len(index))
+        values = {
+            "daily_avg": index.mean("sales", lo, hi),
+            "daily_units": index.mean("units", lo, hi),
+            "sales_7d": index.trailing("sales", 7, lo, hi),
+            "units_30d": index.trailing("units", 30, lo, hi),
+        }
+    return {
+        **values,
+        "new_customers": customers["new_customers_today"],
+        "avg_order_value": customers["avg_order_value"],
+    }
+
+
+@cached_by_version()
+def customer_kpis(customers, sales):
+    """Customer card values; customer count, order value and segments come from RFM when orders have customer ids."""
+    scores = customers.table("customer_satisfaction_trend")["score"].to_numpy(dtype=np.float64)
+    segments = segment_counts(sales, customers)
+    kpis = {
+        "total_customers": customers["total_customers"],
+        "new_customers_today": customers["new_customers_today"],
+        "avg_order_value": customers["avg_order_value"],
+        "avg_satisfaction": _mean(scores),
+        # Segment -> customers, best segment first
+        "segments": dict(zip(segments["segment"].tolist(), segments["count"].tolist())),
+    }
+    if "customer_rfm" in sales:
+        rfm = sales.table("customer_rfm")
+        orders = int(rfm["frequency"].sum())
+        kpis["total_customers"] = len(rfm)
+        kpis["avg_order_value"] = round(float(rfm["monetary"].sum()) / orders) if orders else 0
+    return kpis
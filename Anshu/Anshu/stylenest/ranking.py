@@ -0,0 +1,78 @@
+"""
+Product Ranking
+Top-K products by sales, units or margin via partial selection, kept current as orders stream in
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+from stylenest.reorder import reorder_plan
+
+TOP_K = 10
+
+# Ranking depth maintained while orders stream in; deeper requests fall
+# back to a selection over the full product table.
+STREAM_TOP_K = 100
+
+# Ranking metric -> label, for the metrics a product table may carry
+METRICS = {"sales": "Sales ($)", "units": "Units Sold", "margin": "Margin ($)"}
+STOCK_METRICS = {"units_sold": "Units Sold", "stock": "Current Stock", "reorder_qty": "Reorder Qty"}
+
+
+def top_k(frame, column, k=TOP_K):
+    """Rows of frame with the k largest values of column, largest first.
+
+    np.argpartition selects the k rows in O(n) and only those k are sorted,
+    so switching metric never sorts the whole table.
+    """
+    values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    values = np.where(np.isnan(values), -np.inf, values)
+    if k < len(values):
+        selected = np.argpartition(-values, k - 1)[:k]
+    else:
+        selected = np.arange(len(values))
+    selected = selected[np.argsort(-values[selected], kind="stable")]
+    return frame.iloc[selected]
+
+
+class StreamingTopK:
+    """Top-k keys of a running total that only grows between updates.
+
+    After a chunk, only keys whose total changed can enter the ranking: an
+    untouched key was already at or below the old k-th value. Each update
+    therefore ranks the previous top k plus the touched keys instead of
+    every key seen so far.
+    """
+
+    def __init__(self, k=STREAM_TOP_K):
+        self.k = k
+        self.keys = pd.Index([])
+
+    def update(self, totals, touched, decreased=False):
+        """totals: Series of every key's running total; touched: keys changed by the last chunk."""
+        if decreased:
+            # Returns can push a ranked key down below unranked ones
+            candidates = totals
+        else:
+            candidates = totals.reindex(self.keys.append(pd.Index(touched)).unique())
+        self.keys = candidates.nlargest(self.k).index
+
+
+def available_metrics(frame, metrics=METRICS):
+    return [metric for metric in metrics if metric in frame]
+
+
+@cached_by_version(maxsize=32)
+def top_products(sales, metric="sales", k=TOP_K):
+    """Top k rows of product_performance by metric, cached per data version."""
+    streamed = (sales.rankings or {}).get(metric)
+    if streamed is not None and k <= len(streamed):
+        return streamed.head(k)
+    return top_k(sales.table("product_performance"), metric, k)
+
+
+@cached_by_version(maxsize=32)
+def top_stock_items(inventory, metric="units_sold", k=TOP_K):
+    """Top k rows of the reorder plan by metric, cached per data version."""
+    return top_k(reorder_plan(inventory)["products"], metric, k)
@@ -0,0 +1,109 @@
+"""
+Reorder Engine
+Derives stock status, days of cover, reorder points and reorder quantities per product
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+
+# units_sold covers this many days of sales
+SALES_PERIOD_DAYS = 365
+# Extra days of demand held as safety stock on top of the supplier lead time
+SAFETY_DAYS = 7
+# Days of demand a reorder should cover once it arrives
+ORDER_COVER_DAYS = 30
+# Lead time used when there is no supplier data
+DEFAULT_LEAD_TIME_DAYS = 7
+
+STATUSES = ["Out of Stock", "Low Stock", "In Stock"]
+
+
+def lead_time_days(inventory):
+    """Mean supplier delivery time in days."""
+    if "supplier_comparison" not in inventory:
+        return DEFAULT_LEAD_TIME_DAYS
+    delivery = inventory.table("supplier_comparison")["delivery_time"]
+    return float(delivery.mean()) if len(delivery) else DEFAULT_LEAD_TIME_DAYS
+
+
+def _catalog(inventory):
+    """One row per product with units_sold, stock and the explicit reorder_level, if any."""
+    products = inventory.table("top_selling_products")[["product", "units_sold", "stock"]]
+    if "low_stock_items" not in inventory:
+        return products.assign(reorder_level=np.nan)
+    levels = inventory.table("low_stock_items").drop_duplicates("product", keep="last")
+    # Position of each product's row in low_stock_items, or -1
+    level_names = pd.Index(levels["product"].to_numpy(dtype=object))
+    positions = level_names.get_indexer(products["product"].to_numpy(dtype=object))
+    found = positions >= 0
+    level_values = levels["reorder_level"].to_numpy(dtype=np.float64)
+    reorder_level = np.full(len(products), np.nan)
+    reorder_level[found] = level_values[positions[found]]
+    catalog = products.assign(reorder_level=reorder_level)
+
+    # Products listed only as low-stock items have no recorded sales
+    unlisted = np.ones(len(levels), dtype=bool)
+    unlisted[positions[found]] = False
+    unlisted = levels[unlisted]
+    unlisted = pd.DataFrame({
+        "product": unlisted["product"],
+        "units_sold": 0,
+        "stock": unlisted["current_stock"],
+        "reorder_level": unlisted["reorder_level"].astype(np.float64),
+    })
+    return pd.concat([catalog, unlisted], ignore_index=True)
+
+
+def plan_reorders(catalog, lead_time=DEFAULT_LEAD_TIME_DAYS):
+    """Compute the reorder columns for a catalog in one vectorized pass.
+
+    The reorder point is demand over lead time plus safety days unless the
+    catalog lists an explicit reorder_level. A product below its reorder
+    point is Low Stock and gets an order bringing it back up to that point
+    plus ORDER_COVER_DAYS of demand.
+    """
+    units_sold = catalog["units_sold"].to_numpy(dtype=np.float64)
+    stock = catalog["stock"].to_numpy(dtype=np.float64)
+    explicit = catalog["reorder_level"].to_numpy(dtype=np.float64)
+
+    demand = units_sold / SALES_PERIOD_DAYS
+    suggested = np.ceil(demand * (lead_time + SAFETY_DAYS))
+    reorder_point = np.where(np.isnan(explicit), suggested, explicit)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        days_of_cover = np.where(demand > 0, stock / demand, np.nan)
+    status_code = np.select([stock <= 0, stock < reorder_point], [0, 1], 2)
+    order_up_to = reorder_point + np.ceil(demand * ORDER_COVER_DAYS)
+    reorder_qty = np.where(status_code < 2, np.maximum(order_up_to - stock, 0), 0)
+
+    return pd.DataFrame({
+        "product": catalog["product"].to_numpy(),
+        "units_sold": units_sold.astype(np.int64),
+        "stock": stock.astype(np.int64),
+        "daily_demand": demand.round(2),
+        "days_of_cover": days_of_cover.round(1),
+        "reorder_point": reorder_point.astype(np.int64),
+        "suggested_reorder_point": suggested.astype(np.int64),
+        "reorder_qty": reorder_qty.astype(np.int64),
+        "status": pd.Categorical.from_codes(status_code, categories=STATUSES, ordered=True),
+    })
+
+
+@cached_by_version()
+def reorder_plan(inventory):
+    """Reorder tables for the inventory source, computed once per data version.
+
+    Returns a dict with the full per-product plan, the products needing a
+    reorder (most urgent first) and summary counts.
+    """
+    plan = plan_reorders(_catalog(inventory), lead_time_days(inventory))
+    needs_reorder = plan[plan["status"] != "In Stock"]
+    needs_reorder = needs_reorder.sort_values(["status", "days_of_cover", "stock"], na_position="last")
+    return {
+        "products": plan,
+        "low_stock": needs_reorder.reset_index(drop=True),
+        "out_of_stock_items": int((plan["status"] == "Out of Stock").sum()),
+        "low_stock_items": int((plan["status"] == "Low Stock").sum()),
+        "units_to_reorder": int(plan["reorder_qty"].sum()),
+    }
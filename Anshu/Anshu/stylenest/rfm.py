@@ -0,0 +1,135 @@
+"""
+RFM Segmentation
+Recency, frequency and monetary scores and segments per customer, updated as orders arrive
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+from stylenest.cohorts import grow
+
+# Quantile bins per score; 1 is worst, SCORE_BINS best
+SCORE_BINS = 5
+
+# Every customer is rescored once the customer count has grown by this
+# fraction since the bin edges were last set; in between only customers with
+# new orders are
+REBIN_GROWTH = 0.1
+
+SEGMENTS = ["Champions", "Loyal", "New", "Regular", "At Risk", "Hibernating"]
+
+
+def quantile_edges(values, bins=SCORE_BINS):
+    """Inner edges splitting values into bins of (roughly) equal size."""
+    return np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1])
+
+
+def quantile_scores(values, edges):
+    """Score 1..len(edges) + 1 of each value; values on an edge take the lower score."""
+    return (np.searchsorted(edges, values, side="left") + 1).astype(np.int8)
+
+
+def assign_segments(r, f, m):
+    """Segment code (index into SEGMENTS) for arrays of R, F and M scores."""
+    top = SCORE_BINS - 1
+    return np.select(
+        [(r >= top) & (f >= top) & (m >= top),
+         (r >= top) & (f <= 1),
+         f >= top,
+         (r <= 2) & (f >= 2),
+         r <= 2],
+        [0, 2, 1, 4, 5],
+        3,
+    ).astype(np.int8)
+
+
+class RFMAccumulator:
+    """Per-customer last order day, order count and spend, scored on demand.
+
+    add() updates only the customers in a chunk. result() rescores the
+    customers touched since the previous result against the current quantile
+    edges, and rescores everyone with fresh edges only when the customer base
+    has grown by REBIN_GROWTH. Customers are codes of the shared
+    CustomerCodes; rows with code -1 are skipped.
+    """
+
+    def __init__(self, customers):
+        # CustomerCodes mapping codes back to customer ids in result()
+        self._customers = customers
+        self._last = np.empty(0, dtype=np.int64)
+        self._frequency = np.empty(0, dtype=np.int64)
+        self._monetary = np.empty(0, dtype=np.float64)
+        # R, F and M score per customer
+        self._scores = [np.empty(0, dtype=np.int8) for _ in range(3)]
+        self._segments = np.empty(0, dtype=np.int8)
+        self._touched = []
+        self._edges = None
+        self._edges_customers = 0
+
+    def add(self, customers, days, sales):
+        """Customer codes, order days (days since 1970-01-01) and order values of one chunk."""
+        customers = np.asarray(customers, dtype=np.int64)
+        known = customers >= 0
+        customers = customers[known]
+        if not len(customers):
+            return
+        size = len(self._customers)
+        self._last = grow(self._last, size, np.iinfo(np.int64).min)
+        self._frequency = grow(self._frequency, size, 0)
+        self._monetary = grow(self._monetary, size, 0.0)
+        np.maximum.at(self._last, customers, np.asarray(days, dtype=np.int64)[known])
+        np.add.at(self._frequency, customers, 1)
+        np.add.at(self._monetary, customers, np.asarray(sales, dtype=np.float64)[known])
+        self._touched.append(customers)
+
+    def _values(self, customers):
+        return self._last[customers], self._frequency[customers], self._monetary[customers]
+
+    def _score(self, customers):
+        scores = [quantile_scores(values, edges) for values, edges in zip(self._values(customers), self._edges)]
+        for stored, score in zip(self._scores, scores):
+            stored[customers] = score
+        self._segments[customers] = assign_segments(*scores)
+
+    def result(self):
+        """One row per customer with R, F, M values and scores and the segment."""
+        size = len(self._frequency)
+        self._scores = [grow(scores, size, 0) for scores in self._scores]
+        self._segments = grow(self._segments, size, 0)
+        customers = np.flatnonzero(self._frequency)
+        if self._edges is None or len(customers) > self._edges_customers * (1 + REBIN_GROWTH):
+            self._edges = [quantile_edges(values) for values in self._values(customers)]
+            self._edges_customers = len(customers)
+            self._score(customers)
+        elif self._touched:
+            self._score(np.unique(np.concatenate(self._touched)))
+        self._touched = []
+
+        last, frequency, monetary = self._values(customers)
+        as_of = last.max() if len(last) else 0
+        r, f, m = (scores[customers] for scores in self._scores)
+        return pd.DataFrame({
+            "customer_id": self._customers.ids(customers),
+            "recency_days": as_of - last,
+            "frequency": frequency,
+            "monetary": monetary.round(2),
+            "r": r,
+            "f": f,
+            "m": m,
+            "segment": pd.Categorical.from_codes(self._segments[customers], categories=SEGMENTS),
+        })
+
+
+@cached_by_version()
+def segment_counts(sales, customers):
+    """Customers per segment from the RFM table, or the source's customer_segments."""
+    if "customer_rfm" not in sales:
+        return customers.table("customer_segments")
+    segments = sales.table("customer_rfm")["segment"]
+    counts = np.bincount(segments.cat.codes.to_numpy(), minlength=len(SEGMENTS))
+    return pd.DataFrame({
+        "segment": pd.Series(SEGMENTS, dtype="string"),
+        "count": counts.astype(np.int64),
+        "percentage": (counts / max(counts.sum(), 1) * 100).round(1),
+    })
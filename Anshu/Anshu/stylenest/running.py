@@ -0,0 +1,119 @@
+"""
+Running KPIs
+Append-only sales totals with 7-day, 30-day, month-to-date and year-to-date windows
+"""
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# Trailing windows in days, ending at the latest date seen
+WINDOWS = (7, 30)
+
+
+class RunningKPIs:
+    """Sales and units totals kept up to date one day-row at a time.
+
+    append() is O(1) amortized: each day enters every trailing window once
+    and leaves it once, and month/year-to-date sums reset when the latest
+    date crosses a month or year boundary. Rows for a day already seen are
+    merged into it, so order-level rows can be appended directly.
+    """
+
+    def __init__(self):
+        self.total_sales = 0.0
+        self.total_units = 0
+        self.orders = 0
+        self.last_date = None
+        self._days = set()
+        # window -> deque of [day, sales, units], oldest first
+        self._windows = {days: deque() for days in WINDOWS}
+        self._window_sums = {days: [0.0, 0] for days in WINDOWS}
+        self._mtd = [0.0, 0]
+        self._ytd = [0.0, 0]
+
+    def append(self, date, sales, units, orders=1):
+        day = np.datetime64(date, "D")
+        self.total_sales += sales
+        self.total_units += units
+        self.orders += orders
+        self._days.add(day)
+
+        if self.last_date is None or day > self.last_date:
+            previous, self.last_date = self.last_date, day
+            if previous is None or _month(previous) != _month(day):
+                self._mtd = [0.0, 0]
+            if previous is None or _year(previous) != _year(day):
+                self._ytd = [0.0, 0]
+            for days, window in self._windows.items():
+                self._evict(days, window)
+        if _month(day) == _month(self.last_date):
+            self._mtd[0] += sales
+            self._mtd[1] += units
+        if _year(day) == _year(self.last_date):
+            self._ytd[0] += sales
+            self._ytd[1] += units
+        for days, window in self._windows.items():
+            if day > self.last_date - np.timedelta64(days, "D"):
+                self._window_add(days, window, day, sales, units)
+
+    def extend(self, frame, date="date", sales="sales", units="units"):
+        """Append a DataFrame of rows; order-level rows are summed per day first."""
+        if frame.empty:
+            return
+        days = pd.to_datetime(frame[date]).dt.normalize()
+        totals = frame[[sales, units]].groupby(days).agg(["sum", "size"])
+        for day, row in zip(totals.index.to_numpy(), totals.itertuples(index=False)):
+            self.append(day, float(row[0]), int(row[2]), orders=int(row[1]))
+
+    def _evict(self, days, window):
+        start = self.last_date - np.timedelta64(days, "D")
+        sums = self._window_sums[days]
+        while window and window[0][0] <= start:
+            _, sales, units = window.popleft()
+            sums[0] -= sales
+            sums[1] -= units
+
+    def _window_add(self, days, window, day, sales, units):
+        sums = self._window_sums[days]
+        sums[0] += sales
+        sums[1] += units
+        # Late rows land at most `days` entries from the right end
+        position = len(window)
+        while position and window[position - 1][0] > day:
+            position -= 1
+        if position and window[position - 1][0] == day:
+            window[position - 1][1] += sales
+            window[position - 1][2] += units
+        else:
+            window.insert(position, [day, sales, units])
+
+    def snapshot(self):
+        """Plain dict of every maintained value, safe to share between sessions."""
+        days = len(self._days)
+        values = {
+            "total_sales": self.total_sales,
+            "total_units": self.total_units,
+            "orders": self.orders,
+            "days": days,
+            "daily_avg": self.total_sales / days if days else 0.0,
+            "daily_units": self.total_units / days if days else 0.0,
+            "sales_mtd": self._mtd[0],
+            "units_mtd": self._mtd[1],
+            "sales_ytd": self._ytd[0],
+            "units_ytd": self._ytd[1],
+            "last_date": None if self.last_date is None else pd.Timestamp(self.last_date),
+        }
+        for window, (sales, units) in self._window_sums.items():
+            values[f"sales_{window}d"] = sales
+            values[f"units_{window}d"] = units
+        return values
+
+
+def _month(day):
+    return day.astype("datetime64[M]")
+
+
+def _year(day):
+    return day.astype("datetime64[Y]")
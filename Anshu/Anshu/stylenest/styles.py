@@ -0,0 +1,50 @@
+"""
+Stylesheet Injection
+Reads and minifies styles.css once per process and adds it to every page run
+"""
+
+import re
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+CSS_PATH = Path(__file__).parent.parent / "styles.css"
+
+_compiled = (None, "")
+_lock = threading.Lock()
+
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def compiled_css():
+    """Return the minified css, re-reading styles.css only when it changed."""
+    global _compiled
+    try:
+        stat = CSS_PATH.stat()
+    except OSError:
+        return ""
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if _compiled[0] != signature:
+        with _lock:
+            if _compiled[0] != signature:
+                _compiled = (signature, minify_css(CSS_PATH.read_text()))
+    return _compiled[1]
+
+
+def inject_css():
+    """Add the stylesheet to this run of the page.
+
+    A style-only st.html goes to Streamlit's event container and takes no
+    space. Elements a rerun does not emit again are removed, so it is sent
+    on every run; the minified css is built once per process.
+    """
+    css = compiled_css()
+    if css:
+        st.html(f"<style>{css}</style>")
@@ -0,0 +1,311 @@
+"""
+Synthetic Dataset Generator
+Writes schema-compatible sales/inventory/marketing/customers/catalog JSON at any scale,
+plus an optional line-delimited order stream, deterministically from a seed
+
+Usage:
+    python -m stylenest.synth OUT_DIR --days 36500 --products 20000 --campaigns 2000
+    python -m stylenest.synth OUT_DIR --scale 100 --orders 5000000
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CATEGORIES = ["Electronics", "Clothing", "Home & Living", "Accessories"]
+REGIONS = ["North", "South", "East", "West"]
+GROWTH_REGIONS = ["North America", "Europe", "Asia Pacific", "Latin America"]
+PLATFORMS = ["Facebook", "Instagram", "Twitter", "LinkedIn", "TikTok"]
+AGE_GROUPS = ["18-24", "25-34", "35-44", "45-54", "55+"]
+SEGMENTS = ["VIP", "Regular", "New"]
+PRODUCT_NOUNS = ["Headphones", "Smart Watch", "Laptop Stand", "USB-C Cable", "Phone Case",
+                 "Speaker", "Mouse", "Keyboard", "Monitor Stand", "Desk Mat", "Jacket",
+                 "Shirt", "Dress", "Lamp", "Backpack", "Wallet"]
+CAMPAIGN_NAMES = ["Spring Sale", "Summer Blast", "Discount", "Back to School", "Holiday Special",
+                  "Flash Deal", "Clearance", "New Arrivals"]
+
+# Best-selling products flagged as featured in the catalog
+FEATURED_PRODUCTS = 6
+
+# Rows written per chunk for the large sections and the order stream
+CHUNK_ROWS = 100_000
+
+# The generated history ends here unless it would not fit in datetime64[ns]
+END_DATE = pd.Timestamp("2024-12-31")
+
+
+def scale_params(scale):
+    """Generator sizes for a multiple of the bundled data/*.json sizes."""
+    return {"days": 7 * scale, "products": 10 * scale, "campaigns": 5 * scale,
+            "suppliers": 5 * scale}
+
+
+def _dates(days):
+    start = END_DATE - pd.Timedelta(days=days - 1)
+    if start < pd.Timestamp.min.ceil("D"):
+        start = pd.Timestamp.min.ceil("D")
+    if start + pd.Timedelta(days=days - 1) > pd.Timestamp.max:
+        raise ValueError(f"{days} consecutive days do not fit in datetime64[ns]")
+    return pd.date_range(start, periods=days, freq="D")
+
+
+def _products(rng, n):
+    index = np.arange(n)
+    names = [f"{PRODUCT_NOUNS[i % len(PRODUCT_NOUNS)]} {i + 1:05d}" for i in index]
+    # Long-tailed popularity, like a real catalog
+    units = np.maximum(1, (rng.pareto(1.5, n) * 500).astype(np.int64))
+    price = np.round(rng.uniform(5, 250, n), 2)
+    return pd.DataFrame({
+        "product": names,
+        "category": np.array(CATEGORIES)[rng.integers(0, len(CATEGORIES), n)],
+        "price": price,
+        "units": units,
+        "sales": np.round(units * price).astype(np.int64),
+    })
+
+
+def _records(frame):
+    return json.loads(frame.to_json(orient="records", date_format="iso"))
+
+
+def _write_document(path, scalars, sections):
+    """Write one JSON object whose list sections are streamed chunk by chunk."""
+    with open(path, "w") as f:
+        f.write("{")
+        items = [(key, json.dumps(value)) for key, value in scalars.items()]
+        for i, (key, value) in enumerate(items):
+            f.write(f"{',' if i else ''}\n  {json.dumps(key)}: {value}")
+        for i, (key, frame) in enumerate(sections.items(), len(items)):
+            f.write(f"{',' if i else ''}\n  {json.dumps(key)}: [")
+            for start in range(0, len(frame), CHUNK_ROWS):
+                chunk = frame.iloc[start:start + CHUNK_ROWS]
+                body = chunk.to_json(orient="records", date_format="iso")[1:-1]
+                f.write(("," if start else "") + body)
+            f.write("]")
+        f.write("\n}\n")
+
+
+def _daily_sales(rng, dates):
+    n = len(dates)
+    trend = np.linspace(1.0, 1.6, n)
+    season = 1 + 0.15 * np.sin(2 * np.pi * dates.dayofyear.to_numpy() / 365.25)
+    units = np.maximum(1, (140 * trend * season + rng.normal(0, 12, n)).astype(np.int64))
+    sales = np.round(units * rng.normal(16.5, 1.2, n)).astype(np.int64)
+    return pd.DataFrame({"date": dates.strftime("%Y-%m-%d"), "sales": sales, "units": units})
+
+
+def _campaign_events(rng, dates, campaigns):
+    """Daily spend, revenue and conversions of campaigns running 14-60 days each."""
+    names = np.array([f"{CAMPAIGN_NAMES[i % len(CAMPAIGN_NAMES)]} {i + 1:04d}" for i in range(campaigns)],
+                     dtype=object)
+    starts = rng.integers(0, len(dates), campaigns)
+    durations = np.minimum(rng.integers(14, 61, campaigns), len(dates) - starts)
+    campaign = np.repeat(np.arange(campaigns), durations)
+    offset = np.arange(len(campaign)) - np.repeat(np.cumsum(durations) - durations, durations)
+    daily_spend = np.repeat(rng.integers(500, 5000, campaigns) / durations, durations)
+    spend = np.maximum(1, np.round(daily_spend * rng.uniform(0.7, 1.3, len(campaign)))).astype(np.int64)
+    roas = np.repeat(rng.uniform(10, 30, campaigns), durations)
+    revenue = np.round(spend * roas * rng.uniform(0.8, 1.2, len(campaign))).astype(np.int64)
+    return pd.DataFrame({
+        "date": dates[starts[campaign] + offset].strftime("%Y-%m-%d"),
+        "campaign": names[campaign],
+        "spend": spend,
+        "revenue": revenue,
+        "conversions": rng.poisson(revenue / 60),
+    })
+
+
+def generate(out_dir, days=7, products=10, campaigns=5, suppliers=5, orders=0, seed=0):
+    """Write sales.json, inventory.json, marketing.json, customers.json and catalog.json to out_dir.
+
+    With orders > 0 an order-level sales_orders.ndjson is written as well; the
+    dashboards then aggregate it in place of the sales.json sections.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    dates = _dates(days)
+
+    # Sales
+    daily = _daily_sales(rng, dates)
+    month = dates.to_period("M")
+    monthly = daily.groupby(month).agg(revenue=("sales", "sum"), orders=("units", "sum"))
+    monthly = pd.DataFrame({
+        "month": monthly.index.strftime("%b %Y") if len(monthly) > 12 else monthly.index.strftime("%b"),
+        "revenue": monthly["revenue"].to_numpy(),
+        "orders": (monthly["orders"].to_numpy() * 0.8).astype(np.int64),
+    })
+    catalog = _products(rng, products)
+    total_revenue = int(daily["sales"].sum())
+    category_share = rng.dirichlet(np.ones(len(CATEGORIES)) * 4)
+    region_share = rng.dirichlet(np.ones(len(REGIONS)) * 4)
+    _write_document(out_dir / "sales.json", {
+        "total_revenue": total_revenue,
+        "profit_margin": int(rng.integers(12, 25)),
+        "total_orders": int(monthly["orders"].sum()),
+        "customer_satisfaction": int(rng.integers(80, 95)),
+    }, {
+        "monthly_sales": monthly,
+        "category_revenue": pd.DataFrame({"category": CATEGORIES,
+                                          "revenue": np.round(category_share * total_revenue).astype(np.int64)}),
+        "regional_growth": pd.DataFrame({"region": GROWTH_REGIONS,
+                                         "customers": rng.integers(1000, 10000, len(GROWTH_REGIONS)),
+                                         "growth": rng.integers(5, 20, len(GROWTH_REGIONS))}),
+        "daily_sales": daily,
+        "region_sales": pd.DataFrame({"region": REGIONS,
+                                      "sales": np.round(region_share * total_revenue).astype(np.int64)}),
+        "product_performance": catalog.sort_values("sales", ascending=False)[["product", "sales", "units"]],
+    })
+
+    # Inventory
+    stock = np.where(rng.random(products) < 0.05, 0, rng.integers(0, 1500, products))
+    reorder_level = rng.integers(10, 250, products)
+    status = np.select([stock == 0, stock < reorder_level], ["Out of Stock", "Low Stock"], "In Stock")
+    top_selling = pd.DataFrame({"product": catalog["product"], "units_sold": catalog["units"],
+                                "stock": stock, "status": status}).sort_values("units_sold", ascending=False)
+    low = stock < reorder_level
+    category_stock = pd.DataFrame({"stock": stock, "category": catalog["category"]}).groupby("category")["stock"].sum()
+    supplier_scores = rng.integers(60, 95, (suppliers, 3))
+    _write_document(out_dir / "inventory.json", {
+        "stock_available": int(stock.sum()),
+        "out_of_stock_items": int((stock == 0).sum()),
+        "inventory_turnover_ratio": round(float(catalog["units"].sum() / max(stock.sum(), 1)), 1),
+        "supplier_performance_score": int(supplier_scores.mean()),
+    }, {
+        "category_stock": pd.DataFrame({"category": category_stock.index,
+                                        "stock": category_stock.to_numpy(),
+                                        "threshold": (category_stock.to_numpy() * 0.35).astype(np.int64)}),
+        "top_selling_products": top_selling,
+        "supplier_comparison": pd.DataFrame({
+            "supplier": [f"Supplier {i + 1:04d}" for i in range(suppliers)],
+            "delivery_time": rng.integers(2, 10, suppliers),
+            "quality_score": supplier_scores[:, 0],
+            "price_score": supplier_scores[:, 1],
+            "total_score": supplier_scores.mean(axis=1).round().astype(np.int64),
+        }),
+        "low_stock_items": pd.DataFrame({"product": catalog["product"][low], "current_stock": stock[low],
+                                         "reorder_level": reorder_level[low]}),
+    })
+
+    # Marketing
+    campaign_events = _campaign_events(rng, dates, campaigns)
+    campaign_roi = campaign_events.groupby("campaign", sort=False)[["spend", "revenue"]].sum().reset_index()
+    spend, revenue = campaign_roi["spend"].to_numpy(), campaign_roi["revenue"].to_numpy()
+    campaign_roi["roi"] = np.round((revenue - spend) / spend * 100).astype(np.int64)
+    demographics = rng.dirichlet(np.ones(len(AGE_GROUPS)) * 3)
+    audience = int(rng.integers(10_000, 50_000))
+    months = monthly["month"].tolist()
+    _write_document(out_dir / "marketing.json", {
+        "website_visits": int(rng.integers(50_000, 500_000)),
+        "conversion_rate": round(float(rng.uniform(1, 6)), 1),
+        "ad_spend": int(spend.sum()),
+        "best_campaign": str(campaign_roi.loc[campaign_roi["roi"].idxmax(), "campaign"]),
+    }, {
+        "social_media_engagement": pd.DataFrame({"platform": PLATFORMS,
+                                                 "engagement": rng.integers(10_000, 80_000, len(PLATFORMS)),
+                                                 "followers": rng.integers(40_000, 200_000, len(PLATFORMS))}),
+        "campaign_roi": campaign_roi,
+        "campaign_events": campaign_events,
+        "customer_demographics": pd.DataFrame({"age_group": AGE_GROUPS,
+                                               "percentage": np.round(demographics * 100).astype(np.int64),
+                                               "count": np.round(demographics * audience).astype(np.int64)}),
+        "monthly_visits": pd.DataFrame({"month": months,
+                                        "visits": rng.integers(10_000, 20_000, len(months))}),
+    })
+
+    # Customers
+    segment_share = np.array([0.1, 0.7, 0.2])
+    total_customers = int(rng.integers(10_000, 100_000))
+    _write_document(out_dir / "customers.json", {
+        "total_customers": total_customers,
+        "new_customers_today": int(rng.integers(5, 50)),
+        "avg_order_value": int(rng.integers(30, 80)),
+    }, {
+        "customer_segments": pd.DataFrame({"segment": SEGMENTS,
+                                           "count": np.round(segment_share * total_customers).astype(np.int64),
+                                           "percentage": np.round(segment_share * 100).astype(np.int64)}),
+        "customer_acquisition": pd.DataFrame({"month": months,
+                                              "new_customers": rng.integers(1500, 2500, len(months))}),
+        "customer_satisfaction_trend": pd.DataFrame({"month": months,
+                                                     "score": rng.integers(84, 92, len(months))}),
+    })
+
+    # Catalog
+    featured = np.zeros(products, dtype=bool)
+    featured[np.argsort(-catalog["units"].to_numpy(), kind="stable")[:FEATURED_PRODUCTS]] = True
+    _write_document(out_dir / "catalog.json", {}, {
+        "products": pd.DataFrame({
+            "sku": [f"SKU-{i + 1:06d}" for i in range(products)],
+            "product": catalog["product"],
+            "category": catalog["category"],
+            "price": catalog["price"],
+            "featured": featured,
+        }),
+    })
+
+    if orders:
+        write_orders(out_dir / "sales_orders.ndjson", catalog, dates, orders, rng)
+
+
+def iter_orders(catalog, dates, orders, rng, customers=None):
+    """Yield DataFrames of synthetic orders, CHUNK_ROWS at a time."""
+    customers = customers or max(orders // 8, 1)
+    popularity = catalog["units"].to_numpy(dtype=np.float64)
+    popularity /= popularity.sum()
+    names = catalog["product"].to_numpy()
+    categories = catalog["category"].to_numpy()
+    prices = catalog["price"].to_numpy()
+    # Unit cost as a fixed share of each product's price
+    cost_share = rng.uniform(0.45, 0.8, len(names))
+    day_strings = dates.strftime("%Y-%m-%d").to_numpy()
+    for start in range(0, orders, CHUNK_ROWS):
+        n = min(CHUNK_ROWS, orders - start)
+        product = rng.choice(len(names), n, p=popularity)
+        units = rng.integers(1, 4, n)
+        yield pd.DataFrame({
+            # Orders spread evenly over the history and stay in date order across chunks
+            "date": day_strings[((start + np.arange(n) + rng.random(n)) * len(day_strings) // orders).astype(np.int64)],
+            "order_id": np.arange(start, start + n),
+            # Customers join at a steady rate and then keep ordering
+            "customer_id": (rng.random(n) * np.maximum(customers * (start + np.arange(n) + 1) / orders, 1))
+                           .astype(np.int64),
+            "product": names[product],
+            "category": categories[product],
+            "region": np.array(REGIONS)[rng.integers(0, len(REGIONS), n)],
+            "units": units,
+            "sales": np.round(prices[product] * units, 2),
+            "cost": np.round(prices[product] * cost_share[product] * units, 2),
+        })
+
+
+def write_orders(path, catalog, dates, orders, rng):
+    """Stream orders to NDJSON without materializing them all at once."""
+    with open(path, "w") as f:
+        for chunk in iter_orders(catalog, dates, orders, rng):
+            f.write(chunk.to_json(orient="records", lines=True))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("out_dir")
+    parser.add_argument("--scale", type=int, help="multiple of the bundled data sizes")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--products", type=int, default=10)
+    parser.add_argument("--campaigns", type=int, default=5)
+    parser.add_argument("--suppliers", type=int, default=5)
+    parser.add_argument("--orders", type=int, default=0, help="also write sales_orders.ndjson")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    params = {"days": args.days, "products": args.products, "campaigns": args.campaigns,
+              "suppliers": args.suppliers}
+    if args.scale:
+        params = scale_params(args.scale)
+    generate(args.out_dir, orders=args.orders, seed=args.seed, **params)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Table Rendering
+Column configurations and server-side paged, sorted and searchable tables
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import streamlit as st
+
+from stylenest.reorder import STATUSES
+
+PAGE_SIZE = 50
+
+# Tables whose indexes are kept, most recently used last
+MAX_INDEXES = 16
+
+# Badge colors for STATUSES, in the same order
+STATUS_COLORS = ["#ef4444", "#f59e0b", "#10b981"]
+
+
+def money_column(label, decimals=0):
+    """Dollar column; values stay numeric so the grid sorts them as numbers."""
+    return st.column_config.NumberColumn(label, format="dollar", step=10 ** -decimals)
+
+
+def percent_column(label, decimals=0):
+    """Percentage column for values stored in percentage points (12.5 -> 12.5%)."""
+    return st.column_config.NumberColumn(label, format=f"%.{decimals}f%%")
+
+
+def count_column(label):
+    """Integer column with thousands separators."""
+    return st.column_config.NumberColumn(label, format="localized", step=1)
+
+
+def status_column(label="Status"):
+    """Colored badge column for a stock status.
+
+    The badges are drawn by the dataframe component itself, so a categorical
+    status column is sent once as Arrow dictionary codes with no per-cell CSS.
+    """
+    return st.column_config.MultiselectColumn(label, options=STATUSES, color=STATUS_COLORS)
+
+
+def _tokens(text):
+    return re.findall(r"[^\W_]+", text.lower())
+
+
+class TableIndex:
+    """Sort orders and a word-prefix index over one table.
+
+    Search terms match the start of any word in text_column. Words are kept
+    in one sorted vocabulary with the rows of each word stored contiguously,
+    so the rows for a prefix are a single slice found by binary search.
+    Sort orders are computed the first time a column is sorted on and then
+    reused, so paging through a sorted, filtered view never rescans the table.
+    """
+
+    def __init__(self, frame, text_column="product"):
+        self.frame = frame
+        self.text_column = text_column
+        self._orders = {}
+        self._ranks = {}
+
+        names = pa.array(frame[text_column].to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+        words = pc.split_pattern_regex(pc.utf8_lower(names), r"[^\p{L}\p{N}]+")
+        tokens = pc.list_flatten(words)
+        rows = pc.list_parent_indices(words)
+        keep = pc.not_equal(tokens, "")
+        tokens, rows = pc.filter(tokens, keep), pc.filter(rows, keep)
+        order = pc.sort_indices(tokens)
+        # Dictionary codes of sorted tokens are non-decreasing and the
+        # dictionary itself is the sorted vocabulary.
+        encoded = pc.dictionary_encode(tokens.take(order))
+        codes = encoded.indices.to_numpy()
+        self._vocabulary = encoded.dictionary.to_numpy(zero_copy_only=False)
+        self._starts = np.searchsorted(codes, np.arange(len(self._vocabulary) + 1))
+        self._postings = rows.take(order).to_numpy()
+
+    def __len__(self):
+        return len(self.frame)
+
+    def search(self, query):
+        """Sorted row positions whose text has a word starting with every query term."""
+        matches = None
+        for term in _tokens(query):
+            lo = np.searchsorted(self._vocabulary, term, side="left")
+            hi = np.searchsorted(self._vocabulary, term + "\U0010ffff", side="left")
+            rows = np.unique(self._postings[self._starts[lo]:self._starts[hi]])
+            matches = rows if matches is None else np.intersect1d(matches, rows, assume_unique=True)
+        return matches
+
+    def order(self, column, descending=False):
+        """Row positions sorted by column, missing values last."""
+        key = (column, descending)
+        if key not in self._orders:
+            values = self.frame[column].reset_index(drop=True)
+            sorted_values = values.sort_values(ascending=not descending, kind="stable", na_position="last")
+            self._orders[key] = sorted_values.index.to_numpy()
+        return self._orders[key]
+
+    def _rank(self, column, descending):
+        key = (column, descending)
+        if key not in self._ranks:
+            rank = np.empty(len(self), dtype=np.int64)
+            rank[self.order(column, descending)] = np.arange(len(self))
+            self._ranks[key] = rank
+        return self._ranks[key]
+
+    def page(self, start, stop, sort_by=None, descending=False, rows=None):
+        """Positions of rows [start, stop) of the view limited to rows and sorted by sort_by."""
+        if rows is None:
+            if sort_by is None:
+                return np.arange(start, min(stop, len(self)))
+            return self.order(sort_by, descending)[start:stop]
+        if sort_by is None:
+            return rows[start:stop]
+        ranks = self._rank(sort_by, descending)[rows]
+        return rows[np.argsort(ranks, kind="stable")[start:stop]]
+
+
+_indexes = OrderedDict()
+_lock = threading.Lock()
+
+
+def table_index(key, frame, text_column="product"):
+    """Return the TableIndex for frame, building it once per key.
+
+    key must change whenever frame does; (table id, data version) is typical.
+    """
+    with _lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = TableIndex(frame, text_column)
+    with _lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def _column_label(column, column_config):
+    config = column_config.get(column)
+    if isinstance(config, str):
+        return config
+    if isinstance(config, dict) and config.get("label"):
+        return config["label"]
+    return column
+
+
+def paged_table(index, key, columns, column_config=None, page_size=PAGE_SIZE,
+                sort_by=None, descending=True, noun="products"):
+    """Render one page of an indexed table with search, sort and page controls.
+
+    Only the rows of the visible page are sliced out and sent to the browser.
+    """
+    column_config = column_config or {}
+    search_col, sort_col, order_col, page_col = st.columns([3, 2, 1, 1])
+    with search_col:
+        query = st.text_input("Search", key=f"{key}_search", placeholder=f"Search {noun}",
+                              label_visibility="collapsed")
+    with sort_col:
+        sort_by = st.selectbox("Sort by", options=columns, key=f"{key}_sort",
+                               index=columns.index(sort_by) if sort_by in columns else 0,
+                               format_func=lambda column: f"Sort by {_column_label(column, column_config)}",
+                               label_visibility="collapsed")
+    with order_col:
+        descending = st.toggle("Desc", value=descending, key=f"{key}_desc")
+
+    rows = index.search(query) if query.strip() else None
+    total = len(index) if rows is None else len(rows)
+    pages = max(math.ceil(total / page_size), 1)
+    with page_col:
+        page = st.number_input("Page", min_value=1, value=1, step=1, key=f"{key}_page",
+                               label_visibility="collapsed")
+    page = min(page, pages)
+
+    start = (page - 1) * page_size
+    positions = index.page(start, start + page_size, sort_by, descending, rows)
+    st.dataframe(index.frame[columns].iloc[positions], width="stretch", hide_index=True,
+                 column_config=column_config)
+    if total:
+        st.caption(f"{start + 1:,}–{start + len(positions):,} of {total:,} {noun} · page {page} of {pages}")
+    else:
+        st.caption(f"No {noun} match “{query}”")
@@ -0,0 +1,82 @@
+"""
+Sorted Time Index
+Binary-searchable daily rows with prefix sums, so date-range totals cost O(log n)
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cache import cached_by_version
+
+
+class TimeIndex:
+    """Daily rows sorted by date, with a prefix sum per measure column.
+
+    locate() maps a date range to row positions by binary search and total()
+    answers range sums from the prefix arrays, so neither depends on the
+    length of the history. slice() returns only the k rows of the range.
+    """
+
+    def __init__(self, frame, column="date", measures=("sales", "units")):
+        if not frame[column].is_monotonic_increasing:
+            frame = frame.sort_values(column, kind="stable").reset_index(drop=True)
+        self.frame = frame
+        self.column = column
+        self._keys = frame[column].to_numpy(dtype="datetime64[ns]")
+        self._prefix = {
+            measure: np.concatenate(([0.0], np.cumsum(frame[measure].to_numpy(dtype=np.float64))))
+            for measure in measures
+        }
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def first(self):
+        return pd.Timestamp(self._keys[0]) if len(self) else None
+
+    @property
+    def last(self):
+        return pd.Timestamp(self._keys[-1]) if len(self) else None
+
+    def locate(self, start=None, end=None):
+        """Row positions (lo, hi) of the dates in [start, end], both inclusive."""
+        lo = 0 if start is None else int(np.searchsorted(self._keys, np.datetime64(start, "D"), side="left"))
+        if end is None:
+            return lo, len(self)
+        stop = np.datetime64(end, "D") + np.timedelta64(1, "D")
+        return lo, int(np.searchsorted(self._keys, stop, side="left"))
+
+    def window(self, dates):
+        """Row positions (lo, hi) of a (start, end) date range, or None for all rows."""
+        return None if dates is None else self.locate(*dates)
+
+    def total(self, measure, lo=0, hi=None):
+        prefix = self._prefix[measure]
+        hi = len(self) if hi is None else hi
+        return float(prefix[hi] - prefix[lo])
+
+    def mean(self, measure, lo=0, hi=None):
+        hi = len(self) if hi is None else hi
+        return self.total(measure, lo, hi) / (hi - lo) if hi > lo else 0.0
+
+    def trailing(self, measure, days, lo=0, hi=None):
+        """Total over the `days` calendar days ending at row hi - 1, not reaching before lo."""
+        hi = len(self) if hi is None else hi
+        if hi <= lo:
+            return 0.0
+        start = self._keys[hi - 1] - np.timedelta64(days - 1, "D")
+        return self.total(measure, max(int(np.searchsorted(self._keys, start, side="left")), lo), hi)
+
+    def slice(self, lo=0, hi=None):
+        return self.frame.iloc[lo:hi]
+
+    def rollup(self, freq, lo=0, hi=None):
+        """Totals of rows [lo, hi) per period of a pandas frequency, e.g. "W" or "MS"."""
+        return self.slice(lo, hi).set_index(self.column).resample(freq).sum().reset_index()
+
+
+@cached_by_version()
+def daily_sales_index(sales):
+    """TimeIndex over daily_sales, built once per data version."""
+    return TimeIndex(sales.table("daily_sales"))
@@ -0,0 +1,79 @@
+"""
+Shared Widgets
+Streamlit controls reused across the dashboard pages
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from stylenest.downsample import POINT_BUDGET
+
+# Refresh intervals offered in live mode, in seconds
+LIVE_INTERVALS = (2, 5, 10, 30, 60)
+LIVE_INTERVAL = int(os.environ.get("STYLENEST_LIVE_INTERVAL", "5"))
+
+
+def zoom_window(values, key, budget=POINT_BUDGET):
+    """Range slider over a sorted x column, shown only when it exceeds the point budget.
+
+    Returns the visible window as positional (start, stop), or None when the
+    whole series fits. Narrowing the window re-downsamples only that range,
+    so zooming in reveals detail hidden at the full extent.
+    """
+    n = len(values)
+    if n <= budget:
+        return None
+    if pd.api.types.is_datetime64_any_dtype(values):
+        first, last = values.iloc[0].date(), values.iloc[-1].date()
+        start, end = st.slider("Zoom", min_value=first, max_value=last, value=(first, last),
+                               key=key, label_visibility="collapsed")
+        positions = values.to_numpy()
+        lo = int(np.searchsorted(positions, np.datetime64(start), side="left"))
+        hi = int(np.searchsorted(positions, np.datetime64(end) + np.timedelta64(1, "D"), side="left"))
+    else:
+        labels = values.tolist()
+        start, end = st.select_slider("Zoom", options=range(n), value=(0, n - 1),
+                                      format_func=lambda i: labels[i],
+                                      key=key, label_visibility="collapsed")
+        lo, hi = start, end + 1
+    if (lo, hi) == (0, n):
+        return None
+    return (lo, hi)
+
+
+def date_range_filter(index, key, label="Date range"):
+    """Sidebar date picker over a TimeIndex.
+
+    Returns the selected (start, end) dates, or None when the whole history
+    is selected. Dates stay valid while live mode appends days; callers turn
+    them into rows of the current index with TimeIndex.window().
+    """
+    if not len(index):
+        return None
+    first, last = index.first.date(), index.last.date()
+    selected = st.sidebar.date_input(label, value=(first, last), min_value=first,
+                                     max_value=last, key=key)
+    # While a range is being picked only its start has been chosen
+    if not isinstance(selected, (tuple, list)):
+        selected = (selected,)
+    start = selected[0] if len(selected) > 0 else first
+    end = selected[1] if len(selected) > 1 else last
+    if index.locate(start, end) == (0, len(index)):
+        return None
+    return (start, end)
+
+
+def live_refresh(key):
+    """Sidebar live-mode switch; returns the refresh interval in seconds, or None when off.
+
+    Pages pass the interval to st.fragment(run_every=...) so that only their
+    data sections rerun on each tick, never the whole script.
+    """
+    if not st.sidebar.toggle("Live mode", key=f"{key}_live"):
+        return None
+    default = LIVE_INTERVAL if LIVE_INTERVAL in LIVE_INTERVALS else 5
+    return st.sidebar.select_slider("Refresh every", options=LIVE_INTERVALS, value=default,
+                                    format_func=lambda seconds: f"{seconds}s", key=f"{key}_interval")
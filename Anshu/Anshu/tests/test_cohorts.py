@@ -0,0 +1,61 @@
+"""
+Cohort Tests
+Customer codes and monthly cohort retention of stylenest.cohorts against a pandas recompute
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cohorts import CohortAccumulator, CustomerCodes, month_numbers
+
+
+def orders(n=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        # Sparse, large ids
+        "customer_id": rng.integers(0, 400, n) * 12_500_000_000,
+        "date": pd.Timestamp("2023-01-01") + pd.to_timedelta(rng.integers(0, 540, n), unit="D"),
+    })
+
+
+def expected(frame):
+    months = frame["date"].dt.to_period("M")
+    first = months.groupby(frame["customer_id"]).transform("min")
+    periods = (months - first).map(lambda offset: offset.n)
+    cells = pd.DataFrame({"cohort": first.dt.to_timestamp(), "period": periods, "customer_id": frame["customer_id"]})
+    counts = cells.groupby(["cohort", "period"])["customer_id"].nunique()
+    return counts.reset_index(name="customers")
+
+
+def accumulate(frame, chunks=4):
+    codes, cohorts = CustomerCodes(), CohortAccumulator()
+    for rows in np.array_split(np.arange(len(frame)), chunks):
+        part = frame.iloc[rows]
+        cohorts.add(codes.encode(part["customer_id"].to_numpy()), month_numbers(part["date"]))
+    return codes, cohorts.result()
+
+
+def test_codes_are_dense_and_persistent():
+    codes = CustomerCodes()
+    assert codes.encode(np.array([5e9, 7, 5e9])).tolist() == [0, 1, 0]
+    assert codes.encode(np.array([7, 42, np.nan])).tolist() == [1, 2, -1]
+    assert codes.encode(np.array(["a", None, "a"], dtype=object)).tolist() == [3, -1, 3]
+    assert len(codes) == 4
+    assert codes.ids([2, 3]).tolist() == [42, "a"]
+
+
+def test_retention_matches_a_recompute():
+    frame = orders()
+    codes, result = accumulate(frame)
+    assert len(codes) == frame["customer_id"].nunique()
+    pd.testing.assert_frame_equal(result, expected(frame), check_dtype=False)
+
+
+def test_rows_without_a_customer_are_skipped():
+    frame = orders()
+    with_missing = frame.astype({"customer_id": "float64"})
+    with_missing.loc[::7, "customer_id"] = np.nan
+    _, result = accumulate(with_missing)
+    pd.testing.assert_frame_equal(result, expected(with_missing.dropna()), check_dtype=False)
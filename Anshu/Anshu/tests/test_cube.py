@@ -0,0 +1,61 @@
+"""
+Sales Cube Tests
+Drill-down children and monthly trends of stylenest.cube.SalesCube against plain groupbys
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cube import SalesCube
+
+
+def cells(n=2_000):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        "region": rng.choice(["North", "South", "East"], n),
+        "category": rng.choice(["Apparel", "Electronics", "Home"], n),
+        "product": rng.choice([f"P{i}" for i in range(12)], n),
+        "month": rng.choice(pd.date_range("2024-01-01", periods=6, freq="MS").to_numpy(), n),
+        "sales": rng.random(n) * 100,
+        "units": rng.integers(1, 5, n),
+    })
+    return frame
+
+
+def expected_children(frame, path):
+    dimensions = ["region", "category", "product"]
+    for dimension, label in zip(dimensions, path):
+        frame = frame[frame[dimension] == label]
+    dimension = dimensions[len(path)]
+    totals = frame.groupby(dimension)[["sales", "units"]].sum().sort_values("sales", ascending=False)
+    return totals.index.tolist(), totals["sales"].to_numpy(), totals["units"].tolist()
+
+
+def test_children_at_every_depth():
+    frame = cells()
+    cube = SalesCube(frame)
+    for path in [(), ("North",), ("South", "Home")]:
+        children = cube.children(path)
+        labels, sales, units = expected_children(frame, path)
+        assert children.iloc[:, 0].tolist() == labels
+        np.testing.assert_allclose(children["sales"].to_numpy(), sales)
+        assert children["units"].tolist() == units
+
+
+def test_trend():
+    frame = cells()
+    cube = SalesCube(frame)
+    trend = cube.trend(("East", "Apparel"))
+    subset = frame[(frame["region"] == "East") & (frame["category"] == "Apparel")]
+    expected = subset.groupby("month")["sales"].sum()
+    assert trend["month"].tolist() == expected.index.tolist()
+    np.testing.assert_allclose(trend["sales"].to_numpy(), expected.to_numpy())
+    assert cube.trend()["units"].sum() == frame["units"].sum()
+
+
+def test_unknown_path_is_empty():
+    cube = SalesCube(cells())
+    assert cube.children(("West",)).empty
+    assert cube.trend(("North", "Toys")).empty
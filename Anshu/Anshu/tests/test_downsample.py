@@ -0,0 +1,49 @@
+"""
+Downsampling Tests
+Point budgets, endpoints and peaks of stylenest.downsample
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.downsample import downsample, lttb_indices, minmax_indices
+
+
+def series(n=10_000):
+    frame = pd.DataFrame({"date": pd.date_range("2000-01-01", periods=n, freq="D"),
+                          "sales": np.sin(np.arange(n) / 50.0)})
+    # One spike that any reduction must keep
+    frame.loc[n // 3, "sales"] = 10.0
+    return frame
+
+
+def test_lttb_keeps_budget_endpoints_and_peak():
+    frame = series()
+    indices = lttb_indices(frame["date"].to_numpy(), frame["sales"].to_numpy(), 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(frame) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert len(frame) // 3 in indices
+
+
+def test_lttb_small_inputs_are_kept_whole():
+    assert lttb_indices(np.arange(5), np.arange(5), 10).tolist() == [0, 1, 2, 3, 4]
+    assert lttb_indices(np.arange(5), np.arange(5), 2).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_minmax_keeps_bucket_extremes():
+    y = series()["sales"].to_numpy()
+    indices = minmax_indices(y, 200)
+    assert len(indices) <= 200
+    assert y.argmax() in indices and y.argmin() in indices
+
+
+def test_downsample_window_and_alignment():
+    frame = series()
+    window = downsample(frame, "date", "sales", n_out=100, window=(1000, 1050))
+    assert window.equals(frame.iloc[1000:1050])
+    reduced = downsample(frame, "date", "sales", n_out=100)
+    assert len(reduced) == 100
+    assert reduced.equals(frame.loc[reduced.index])
@@ -0,0 +1,134 @@
+"""
+Order Stream Tests
+Append, partial-line and rewrite handling of stylenest.ingest.OrderStream
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import json
+
+import pytest
+
+from stylenest import data
+from stylenest.ingest import OrderStream
+
+ORDERS = [
+    {"date": "2024-01-01", "sales": 100.0, "units": 1, "product": "Smart Watch"},
+    {"date": "2024-01-02", "sales": 50.0, "units": 2, "product": "Phone Case"},
+    {"date": "2024-02-01", "sales": 25.0, "units": 1, "product": "Smart Watch"},
+]
+
+
+def lines(*orders):
+    return "".join(json.dumps(order) + "\n" for order in orders)
+
+
+def totals(stream):
+    scalars, tables = stream.accumulator.result()
+    products = tables["product_performance"].set_index("product")["sales"].to_dict()
+    return scalars["total_orders"], scalars["total_revenue"], products
+
+
+@pytest.fixture
+def export(tmp_path):
+    return tmp_path / "sales_orders.ndjson"
+
+
+def test_full_read(export):
+    export.write_text(lines(*ORDERS))
+    stream = OrderStream(export, chunk_rows=2)
+    assert stream.poll() == 3
+    assert totals(stream) == (3, 175, {"Smart Watch": 125, "Phone Case": 50})
+    assert stream.offset == export.stat().st_size
+
+
+def test_append_reads_only_new_lines(export):
+    export.write_text(lines(*ORDERS[:2]))
+    stream = OrderStream(export)
+    stream.poll()
+    offset = stream.offset
+    with open(export, "a") as f:
+        f.write(lines(ORDERS[2]))
+    assert stream.poll() == 1
+    assert stream.offset > offset
+    assert totals(stream) == (3, 175, {"Smart Watch": 125, "Phone Case": 50})
+    assert stream.poll() == 0
+
+
+def test_last_line_without_newline(export):
+    export.write_text(lines(*ORDERS[:2]).rstrip("\n"))
+    stream = OrderStream(export)
+    assert stream.poll() == 2
+    assert totals(stream)[:2] == (2, 150)
+    # The next append starts with the missing newline
+    with open(export, "a") as f:
+        f.write("\n" + lines(ORDERS[2]))
+    assert stream.poll() == 1
+    assert totals(stream)[:2] == (3, 175)
+
+
+def test_partial_line_waits(export):
+    export.write_text(lines(ORDERS[0]))
+    stream = OrderStream(export)
+    stream.poll()
+    line = lines(ORDERS[1])
+    with open(export, "a") as f:
+        f.write(line[:20])
+    assert stream.poll() == 0
+    assert totals(stream)[:2] == (1, 100)
+    with open(export, "a") as f:
+        f.write(line[20:])
+    assert stream.poll() == 1
+    assert totals(stream)[:2] == (2, 150)
+
+
+def test_truncated_file_is_read_again(export):
+    export.write_text(lines(*ORDERS))
+    stream = OrderStream(export)
+    stream.poll()
+    export.write_text(lines(ORDERS[1]))
+    assert stream.poll() == 1
+    assert totals(stream) == (1, 50, {"Phone Case": 50})
+
+
+def test_rewritten_file_is_read_again(export):
+    export.write_text(lines(*ORDERS[:2]))
+    stream = OrderStream(export)
+    stream.poll()
+    # Same length, different bytes before the offset, plus a new line
+    rewritten = lines(*ORDERS[:2]).replace('"sales": 100.0', '"sales": 900.0')
+    export.write_text(rewritten + lines(ORDERS[2]))
+    assert stream.poll() == 3
+    assert totals(stream)[:2] == (3, 975)
+
+
+def test_appends_leave_tables_unbuilt_until_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(data, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(data, "_datasets", {})
+    monkeypatch.setattr(data, "_streams", {})
+    monkeypatch.setattr(data, "_bases", {})
+    (tmp_path / "sales.json").write_text(json.dumps({"profit_margin": 20}))
+    export = tmp_path / data.ORDER_STREAMS["sales"]
+    export.write_text(lines(*ORDERS[:2]))
+    data.get_dataset("sales")
+    # Count table rebuilds from here on
+    accumulator, built = data._streams[export].accumulator, []
+    tables = accumulator.tables
+    accumulator.tables = lambda: built.append(1) or tables()
+    with open(export, "a") as f:
+        f.write(lines(ORDERS[2]))
+    sales = data.get_dataset("sales")
+    assert (sales["total_revenue"], sales.running["total_sales"], sales["profit_margin"]) == (175, 175, 20)
+    assert not built
+    assert sales.table("daily_sales")["sales"].sum() == 175
+    assert "product_performance" in sales
+    assert built == [1]
+
+
+def test_bad_line_resets_the_stream(export):
+    export.write_text(lines(ORDERS[0]) + "{not json}\n")
+    stream = OrderStream(export)
+    with pytest.raises(ValueError):
+        stream.poll()
+    assert stream.offset == 0
+    assert stream.accumulator.orders == 0
@@ -0,0 +1,36 @@
+"""
+KPI Tests
+Sales rollups of stylenest.kpis over the daily sales index
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import pandas as pd
+
+from stylenest.data import parse_source
+from stylenest.kpis import sales_rollups
+
+# 2024-01-01 is a Monday: days 0-6 fall in one week, days 7-40 run into February
+DAYS = pd.date_range("2024-01-01", periods=41, freq="D")
+
+
+def sales(version):
+    daily = [{"date": day.strftime("%Y-%m-%d"), "sales": 10.0 * (i + 1), "units": 1}
+             for i, day in enumerate(DAYS)]
+    return parse_source("sales", {"total_revenue": 0, "daily_sales": daily}, version)
+
+
+def test_rollups_cover_every_day():
+    rollups = sales_rollups(sales("rollups-all"))
+    assert len(rollups["daily"]) == 41
+    totals = {name: frame["sales"].sum() for name, frame in rollups.items()}
+    assert totals == {"daily": 8610, "weekly": 8610, "monthly": 8610}
+    assert rollups["weekly"]["units"].tolist() == [7, 7, 7, 7, 7, 6]
+    assert rollups["monthly"]["units"].tolist() == [31, 10]
+
+
+def test_rollups_of_a_window():
+    rollups = sales_rollups(sales("rollups-window"), (7, 14))
+    assert rollups["daily"]["date"].tolist() == list(DAYS[7:14])
+    assert rollups["weekly"]["sales"].tolist() == [sum(10.0 * (i + 1) for i in range(7, 14))]
+    assert rollups["monthly"]["units"].tolist() == [7]
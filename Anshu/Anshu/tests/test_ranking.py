@@ -0,0 +1,45 @@
+"""
+Ranking Tests
+Partial top-k selection and streaming top-k maintenance of stylenest.ranking
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.ranking import StreamingTopK, top_k
+
+
+def test_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"product": [f"P{i}" for i in range(1000)], "sales": rng.random(1000)})
+    frame.loc[[3, 7], "sales"] = np.nan
+    expected = frame.sort_values("sales", ascending=False).head(10)
+    assert top_k(frame, "sales", 10)["product"].tolist() == expected["product"].tolist()
+    # Asking for more rows than there are returns all of them, missing values last
+    assert top_k(frame.head(8), "sales", 20)["product"].tolist()[-2:] == ["P3", "P7"]
+
+
+def stream(chunks, k, signed=False):
+    """Feed random chunks to StreamingTopK; yield (ranking, totals) after each."""
+    rng = np.random.default_rng(1)
+    ranking = StreamingTopK(k)
+    totals = pd.Series(dtype=np.float64)
+    for _ in range(chunks):
+        keys = rng.integers(0, 500, 200)
+        amounts = rng.normal(5, 10, 200) if signed else rng.random(200)
+        part = pd.Series(amounts).groupby(keys).sum()
+        totals = totals.add(part, fill_value=0)
+        ranking.update(totals, part.index, decreased=bool((part < 0).any()))
+        yield ranking, totals
+
+
+def test_streaming_top_k_matches_a_full_ranking():
+    for ranking, totals in stream(30, k=20):
+        assert ranking.keys.tolist() == totals.nlargest(20).index.tolist()
+
+
+def test_streaming_top_k_with_decreases():
+    for ranking, totals in stream(30, k=20, signed=True):
+        assert ranking.keys.tolist() == totals.nlargest(20).index.tolist()
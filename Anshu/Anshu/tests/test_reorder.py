@@ -0,0 +1,51 @@
+"""
+Reorder Engine Tests
+Stock status, reorder points and quantities of stylenest.reorder
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.data import parse_source
+from stylenest.reorder import ORDER_COVER_DAYS, SAFETY_DAYS, plan_reorders, reorder_plan
+
+
+def test_plan_reorders():
+    catalog = pd.DataFrame({
+        "product": ["Empty", "Short", "Plenty", "Listed"],
+        # 365 units a year is 1 a day
+        "units_sold": [365, 365, 365, 0],
+        "stock": [0, 5, 1000, 4],
+        "reorder_level": [np.nan, np.nan, np.nan, 5.0],
+    })
+    plan = plan_reorders(catalog, lead_time=3).set_index("product")
+    assert plan["status"].tolist() == ["Out of Stock", "Low Stock", "In Stock", "Low Stock"]
+    assert plan.loc["Short", "reorder_point"] == 3 + SAFETY_DAYS
+    assert plan.loc["Short", "reorder_qty"] == 3 + SAFETY_DAYS + ORDER_COVER_DAYS - 5
+    assert plan.loc["Plenty", "reorder_qty"] == 0
+    assert plan.loc["Plenty", "days_of_cover"] == 1000
+    # An explicit reorder level wins over the suggested point
+    assert plan.loc["Listed", "reorder_point"] == 5
+    assert plan.loc["Listed", "suggested_reorder_point"] == 0
+    assert np.isnan(plan.loc["Listed", "days_of_cover"])
+
+
+def test_reorder_plan_counts_and_order():
+    inventory = parse_source("inventory", {
+        "top_selling_products": [
+            {"product": "A", "units_sold": 3650, "stock": 0},
+            {"product": "B", "units_sold": 3650, "stock": 50},
+            {"product": "C", "units_sold": 3650, "stock": 20},
+            {"product": "D", "units_sold": 10, "stock": 500},
+        ],
+        "low_stock_items": [{"product": "E", "current_stock": 0, "reorder_level": 10}],
+        "supplier_comparison": [{"supplier": "S", "delivery_time": 5, "quality_score": 90,
+                                 "price_score": 80, "total_score": 85}],
+    }, "reorder-test")
+    plan = reorder_plan(inventory)
+    assert (plan["out_of_stock_items"], plan["low_stock_items"]) == (2, 2)
+    # Out of stock first, then the low-stock products with the fewest days of cover
+    assert plan["low_stock"]["product"].tolist() == ["A", "E", "C", "B"]
+    assert plan["units_to_reorder"] == plan["products"]["reorder_qty"].sum()
@@ -0,0 +1,63 @@
+"""
+RFM Tests
+Per-customer recency, frequency and monetary values and scores of stylenest.rfm
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.cohorts import CustomerCodes
+from stylenest.ingest import SalesAccumulator
+from stylenest.rfm import SCORE_BINS, RFMAccumulator, quantile_edges, quantile_scores
+
+
+def orders(n=3_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "customer_id": rng.integers(0, 300, n) * 9_000_000_001,
+        "day": rng.integers(19_000, 19_400, n),
+        "sales": rng.random(n).round(2) * 100,
+    })
+
+
+def accumulate(frame, chunks=5):
+    codes = CustomerCodes()
+    rfm = RFMAccumulator(codes)
+    for rows in np.array_split(np.arange(len(frame)), chunks):
+        part = frame.iloc[rows]
+        rfm.add(codes.encode(part["customer_id"].to_numpy()), part["day"], part["sales"])
+    return rfm.result()
+
+
+def test_values_match_a_groupby():
+    frame = orders()
+    result = accumulate(frame).set_index("customer_id").sort_index()
+    grouped = frame.groupby("customer_id")
+    assert result.index.tolist() == sorted(frame["customer_id"].unique())
+    assert result["frequency"].tolist() == grouped.size().tolist()
+    assert result["recency_days"].tolist() == (frame["day"].max() - grouped["day"].max()).tolist()
+    np.testing.assert_allclose(result["monetary"], grouped["sales"].sum().round(2))
+    for column in ("r", "f", "m"):
+        assert result[column].between(1, SCORE_BINS).all()
+
+
+def test_quantile_scores():
+    values = np.arange(100)
+    edges = quantile_edges(values)
+    assert np.bincount(quantile_scores(values, edges))[1:].tolist() == [20] * SCORE_BINS
+
+
+def test_orders_without_or_with_text_customer_ids():
+    accumulator = SalesAccumulator()
+    accumulator.add(pd.DataFrame({
+        "date": ["2024-01-01", "2024-01-02", "2024-02-01", "2024-02-03"],
+        "sales": [10.0, 20.0, 30.0, 40.0], "units": [1, 1, 1, 1],
+        "customer_id": ["c-1", None, "c-2", "c-1"],
+    }))
+    _, tables = accumulator.result()
+    rfm = tables["customer_rfm"].set_index("customer_id")
+    assert rfm["frequency"].to_dict() == {"c-1": 2, "c-2": 1}
+    assert tables["cohort_retention"]["customers"].sum() == 3
+    assert tables["daily_sales"]["sales"].sum() == 100
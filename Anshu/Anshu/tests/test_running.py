@@ -0,0 +1,59 @@
+"""
+Running KPI Tests
+Totals and trailing, month-to-date and year-to-date windows of stylenest.running.RunningKPIs
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.running import RunningKPIs
+from stylenest.timeindex import TimeIndex
+
+
+def orders(seed=0, n=2_000):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.Timestamp("2023-11-01") + pd.to_timedelta(rng.integers(0, 120, n), unit="D"),
+        "sales": rng.integers(1, 500, n).astype(float),
+        "units": rng.integers(1, 5, n),
+    })
+
+
+def expected(frame):
+    """Every snapshot value recomputed from the whole frame."""
+    daily = frame.groupby(frame["date"].dt.normalize())[["sales", "units"]].sum().reset_index()
+    index = TimeIndex(daily)
+    last = daily["date"].iloc[-1]
+    month = daily[daily["date"] >= last.replace(day=1)]
+    year = daily[daily["date"] >= last.replace(month=1, day=1)]
+    return {
+        "total_sales": frame["sales"].sum(), "total_units": frame["units"].sum(), "orders": len(frame),
+        "days": len(daily), "daily_avg": index.mean("sales"), "daily_units": index.mean("units"),
+        "sales_mtd": month["sales"].sum(), "units_mtd": month["units"].sum(),
+        "sales_ytd": year["sales"].sum(), "units_ytd": year["units"].sum(), "last_date": last,
+        "sales_7d": index.trailing("sales", 7), "units_7d": index.trailing("units", 7),
+        "sales_30d": index.trailing("sales", 30), "units_30d": index.trailing("units", 30),
+    }
+
+
+def test_extend_matches_a_full_recompute():
+    frame = orders()
+    running = RunningKPIs()
+    running.extend(frame)
+    assert running.snapshot() == expected(frame)
+
+
+def test_chunks_and_late_rows_match_a_full_recompute():
+    # Unsorted chunks: later chunks contain days older than the latest seen
+    frame = orders(seed=1)
+    running = RunningKPIs()
+    for chunk in np.array_split(np.arange(len(frame)), 7):
+        running.extend(frame.iloc[chunk])
+    assert running.snapshot() == expected(frame)
+
+
+def test_empty():
+    snapshot = RunningKPIs().snapshot()
+    assert snapshot["total_sales"] == 0 and snapshot["daily_avg"] == 0 and snapshot["last_date"] is None
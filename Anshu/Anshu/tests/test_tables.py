@@ -0,0 +1,42 @@
+"""
+Table Index Tests
+Word-prefix search, sort orders and paging of stylenest.tables.TableIndex
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from stylenest.tables import TableIndex
+
+PRODUCTS = pd.DataFrame({
+    "product": ["Smart Watch", "Phone Case", "Smart-Phone Stand", "Wireless Earbuds", None, "Watch Strap"],
+    "sales": [500, 50, 120, 300, 80, np.nan],
+})
+
+
+def test_search_matches_word_prefixes():
+    index = TableIndex(PRODUCTS)
+    assert index.search("wat").tolist() == [0, 5]
+    assert index.search("PHONE").tolist() == [1, 2]
+    # Every term must match some word
+    assert index.search("smart ph").tolist() == [2]
+    assert index.search("atch").tolist() == []
+    assert index.search("") is None
+
+
+def test_order_puts_missing_values_last():
+    index = TableIndex(PRODUCTS)
+    assert index.order("sales").tolist() == [1, 4, 2, 3, 0, 5]
+    assert index.order("sales", descending=True).tolist() == [0, 3, 2, 4, 1, 5]
+
+
+def test_pages_of_a_sorted_search():
+    index = TableIndex(PRODUCTS)
+    assert index.page(0, 4).tolist() == [0, 1, 2, 3]
+    assert index.page(4, 8).tolist() == [4, 5]
+    assert index.page(0, 2, sort_by="sales", descending=True).tolist() == [0, 3]
+    rows = index.search("smart")
+    assert index.page(0, 10, sort_by="sales", rows=rows).tolist() == [2, 0]
+    assert index.page(1, 10, sort_by="sales", rows=rows).tolist() == [0]
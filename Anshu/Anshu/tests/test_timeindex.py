@@ -0,0 +1,57 @@
+"""
+Time Index Tests
+Date lookup, range totals and trailing windows of stylenest.timeindex.TimeIndex
+
+Run from the project root with:  python -m pytest tests
+"""
+
+import pandas as pd
+
+from stylenest.timeindex import TimeIndex
+
+# Ten days with a gap: 2024-01-01..05, then 2024-01-11..15
+DATES = list(pd.date_range("2024-01-01", periods=5)) + list(pd.date_range("2024-01-11", periods=5))
+
+
+def index():
+    frame = pd.DataFrame({"date": DATES, "sales": [float(i + 1) for i in range(10)], "units": [1] * 10})
+    # Unsorted input is sorted once on construction
+    return TimeIndex(frame.iloc[::-1].reset_index(drop=True))
+
+
+def test_rows_are_sorted():
+    assert index().frame["date"].tolist() == DATES
+    assert (index().first, index().last) == (DATES[0], DATES[-1])
+
+
+def test_locate_is_inclusive_and_skips_gaps():
+    idx = index()
+    assert idx.locate("2024-01-02", "2024-01-04") == (1, 4)
+    assert idx.locate("2024-01-06", "2024-01-10") == (5, 5)
+    assert idx.locate("2024-01-05", "2024-01-11") == (4, 6)
+    assert idx.locate() == (0, 10)
+
+
+def test_totals_and_means():
+    idx = index()
+    assert idx.total("sales") == 55
+    assert idx.total("sales", 1, 4) == 2 + 3 + 4
+    assert idx.mean("units", 2, 7) == 1
+    assert idx.mean("sales", 3, 3) == 0
+
+
+def test_trailing_counts_calendar_days():
+    idx = index()
+    # The 7 days ending 2024-01-15 start at 2024-01-09: rows 5-9
+    assert idx.trailing("sales", 7) == 6 + 7 + 8 + 9 + 10
+    # The 7 days ending 2024-01-11 reach back to 2024-01-05: rows 4-5
+    assert idx.trailing("sales", 7, 0, 6) == 5 + 6
+    # ... but not before the window's first row
+    assert idx.trailing("sales", 7, 5, 6) == 6
+
+
+def test_rollup():
+    # Weeks end on Sunday: 01-07, 01-14 and 01-21
+    weekly = index().rollup("W")
+    assert weekly["date"].dt.strftime("%m-%d").tolist() == ["01-07", "01-14", "01-21"]
+    assert weekly["sales"].tolist() == [1 + 2 + 3 + 4 + 5, 6 + 7 + 8 + 9, 10]